@@ -1,459 +1,679 @@
-"""
-LCCutter is released under "The MIT License (MIT)"
-
-Copyright © 2023 Joseph Alway
-
-Permission is hereby granted, free of charge, to any person obtaining a copy of this software and 
-associated documentation files (the “Software”), to deal in the Software without restriction,
-including without limitation the rights to use, copy, modify, merge, publish, distribute, 
-sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished 
-to do so, subject to the following conditions:
-
-The above copyright notice and this permission notice shall be included in all copies or 
-substantial portions of the Software.
-
-THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
-THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
-OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
-OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
-"""
-
-
-import tkinter as tk
-import random
-import os
-import sys
-
-
-"""
-This program should determine the correct alpha-numeric for a given word used as a Cutter in LC Classification.
-Based off the Cutter table available from the Library of Congress website.
-"""
-
-
-def resource_path(relative_path):
-    """ Get absolute path to resource, works for dev and for PyInstaller """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-
-    return os.path.join(base_path, relative_path)
-
-
-class MainWindow(tk.Frame):
-    def __init__(self, master):
-        tk.Frame.__init__(self, master)
-        self.grid(sticky="ew")
-        self.create_widgets()
-        self.create_menus()
-        self.focus_force()
-        self.my_window = None
-        self.my_word = None
-        self.cutter_entry.focus()
-
-        root.resizable(1, 0)
-
-        # root.grid_rowconfigure(0, weight=1)
-        root.grid_columnconfigure(0, weight=1)
-
-        # self.grid_rowconfigure(0, weight=1)
-        # self.grid_columnconfigure(0, weight=1)
-
-        # self.grid_rowconfigure(1, weight=1)
-        self.grid_columnconfigure(1, weight=1)
-
-        # self.grid_columnconfigure(2, weight=1)
-        self.cutter_display_text.bind("<Button-3>", self.popup_menu)
-
-        # This binds all keys to the cutter entry and runs the new cutter function every time a key is released.
-        # Binding on KeyRelease updates the value of the entry widget, before running the function.
-        # Binding on Key doesn't update the Entry Widget's value until after the function has run.
-        # We want the entry value to include the edit, so we want the Entry widget bound on KeyRelease.
-        # <KeyRelease> fixes an entire workaround that was designed to add the letter of the key press to the label.
-        self.cutter_entry.bind("<KeyRelease>", self.new_cutter)
-
-        # We hid the window as soon as we created the root.
-        # It looks nicer, if you don't see the window being centered.
-        # Center the Window.
-        center(root)
-        # Show the window. Without this, you won't see the window.
-        root.attributes('-alpha', 1.0)
-
-    def copy_to_clipboard(self):
-        try:
-            sel = self.cutter_display_text.get("sel.first", "sel.last")
-            root.clipboard_clear()
-            root.clipboard_append(sel)
-        except tk.TclError:
-            pass
-
-    # Create the GUI for our IntroScreen.
-    def create_widgets(self):
-        self.cutter_entry_label = tk.Label(self, text='Enter a word:')
-        self.cutter_entry_label.grid(sticky="nse")
-
-        self.cutter_entry = tk.Entry(self)
-        self.cutter_entry.config(width=35)
-        self.cutter_entry.grid(row=0, column=1, sticky="nsew")
-
-        # self.cutter_button = tk.Button(self, text="Create Cutter", command=self.new_cutter)
-        # self.cutter_button.grid(row=0, column=2, sticky="nsew")
-
-        self.new_cutter_label = tk.Label(self, text="Cutter:")
-        self.new_cutter_label.grid(row=1, sticky="nse")
-
-        # Use a Disabled Text Widget instead of a Label widget.
-        self.cutter_display_text = tk.Text(self, height=1, width=25, state="disabled")
-        self.cutter_display_text.grid(row=1, column=1, sticky="nsew")
-        self.cutter_display_text.tag_configure("left", justify="left")
-        self.cutter_display_text.tag_configure("color_me_red", foreground="red")
-        self.cutter_display_text.tag_add("left", 1.0, "end")
-
-        self.button = tk.Button(self, text='?', command=self.new_window)
-        self.button.grid(row=1, column=2, sticky="nse")
-
-        # Key Bindings for moving the window. Binds to the window.
-        self.bind("<ButtonPress-1>", self.start_move)
-        self.bind("<ButtonRelease-1>", self.stop_move)
-        self.bind("<B1-Motion>", self.on_move)
-
-    def create_menus(self):
-        self.my_context_menu = tk.Menu(self, tearoff=0)
-        self.my_context_menu.add_command(label="copy", command=self.copy_to_clipboard)
-
-    def popup_menu(self, event):
-        # Enable the copy menu entry, if something is selected in the cutter_display_text widget.
-        # Disable the copy menu entry, if there is nothing selected. Exception is caught, if there's no selection.
-        try:
-            self.cutter_display_text.get("sel.first", "sel.last")
-            self.my_context_menu.entryconfig("copy", state="normal")
-        except tk.TclError:
-            self.my_context_menu.entryconfig("copy", state="disabled")
-        self.my_context_menu.post(event.x_root, event.y_root)
-
-    # This creates one instance of our InfoWindow class.
-    def new_window(self):
-        if self.my_window is None:
-            self.update()
-            x = root.winfo_rootx()
-            y = root.winfo_rooty()
-            height = root.winfo_height()
-            # x, y, and height are in pixels. Add, subtract, divide, etc as needed to place window where you want.
-            geom = "+%d+%d" % (x, y + height)
-            self.my_window = InfoWindow()
-            self.my_window.geometry(geom)
-            # This overrides the normal delete function of a window. Make sure to destroy the related window.
-            self.my_window.wm_protocol("WM_DELETE_WINDOW", self.on_closing)
-            self.my_window.focus()
-        else:
-            self.my_window.focus()
-            pass
-
-    # The key word event allows an event to activate the function. Such as a key press.
-    def new_cutter(self, event=None):
-        # Need to Figure out solution for using delete to delete a letter. Current process lets you use it, but
-        # shows an error message when you press delete. Since, the display won't update unless you press another key.
-
-        # Get the word from the cutter_entry widget.
-        self.my_word = self.cutter_entry.get()
-        # Binding the Entry widget to KeyRelease fixed the need for the workaround.
-        # The following if statement is needed to make sure the cutter_display_text is accurate.
-        # if event.char.isalpha():
-        #     This workaround doesn't work, if you are deleting a character.
-        #     You have to call new_cutter twice for the deleted character to disappear in the cutter_display_text.
-        #     self.my_word = self.my_word + event.char
-        #     pass
-        # We want to ignore the BackSpace key press, so we get the cutter instead of an error displayed.
-        # elif event.keysym == 'BackSpace':
-        #     self.my_word = self.my_word[:-1]
-        #     Fool the rest of the logic into thinking a was pressed, so it doesn't give us an error.
-        #     event.char = 'a'
-        # We want to ignore these key presses, so we get the cutter instead of an error displayed.
-        if event.keysym in 'Shift_L,Shift_R,Caps_Lock,Left,Right,Up,Down,Cancel,End,Home,Print,Insert,Escape':
-            # Fool the rest of the logic into thinking a was pressed, so it doesn't give us an error.
-            event.char = 'a'
-        # Clear the self.cutter_display_text widget of text.
-        self.cutter_display_text.configure(state="normal")
-        self.cutter_display_text.delete(1.0, tk.END)
-        my_word_length = len(self.my_word)
-        # Check to make sure the character entered is a letter and output an error, if not.
-        if event.char.isalpha() is False and event.keysym != 'Delete' and event.keysym != 'BackSpace':
-            self.cutter_display_text.insert(1.0, "Please only use letters.", "color_me_red")
-            self.cutter_display_text.configure(state="disabled")
-        # Display a different note regarding the usage of delete.
-        # elif event.keysym == 'Delete' or event.keysym == 'BackSpace':
-        #     self.cutter_display_text.insert(1.0, "Press a key to update.", "color_me_red")
-        #     self.cutter_display_text.configure(state="disabled")
-        # Insert the word / cutter in the self.cutter_display_text widget.
-        elif my_word_length > 0 and self.my_word.isalpha():
-            new_cutter = LCCutter(self.my_word)
-            my_cutter = new_cutter.get_cutter()
-            self.cutter_display_text.insert(1.0, my_cutter)
-            self.cutter_display_text.configure(state="disabled")
-        # Leave the self.cutter_display_text widget clear, if the word length is 0.
-        elif my_word_length == 0:
-            self.cutter_display_text.configure(state="disabled")
-        # Insert an error to cover all other cases. Example, the word containing a number, but a letter was pressed.
-        else:
-            self.cutter_display_text.insert(1.0, "Please only use letters.", "color_me_red")
-            self.cutter_display_text.configure(state="disabled")
-
-    # Run this when we close the child window self.my_window
-    def on_closing(self):
-        # Destroy the child window.
-        self.my_window.destroy()
-        # Set our window variable back to None.
-        self.my_window = None
-        # You could also do anything else here that you want to happen when closing the child window.
-
-    # Start position for Moving the Window
-    def start_move(self, event):
-        self.move_x = event.x
-        self.move_y = event.y
-
-    # Stop position for Moving the Window
-    def stop_move(self, event):
-        self.move_x = None
-        self.move_y = None
-
-    # Move the Window.
-    def on_move(self, event):
-        delta_x = event.x - self.move_x
-        delta_y = event.y - self.move_y
-        x = root.winfo_x() + delta_x
-        y = root.winfo_y() + delta_y
-        root.geometry("+%s+%s" % (x, y))
-        return
-
-
-# Like the frame, or any widget, this inherited from the parent widget
-class InfoWindow(tk.Toplevel):
-    def __init__(self):
-        tk.Toplevel.__init__(self)
-        self.grid()
-        self.create_widgets()
-        self.focus_force()
-        self.wm_attributes('-toolwindow', True)
-        self.title('Information Page')
-        self.resizable(0, 0)
-        # Variables for moving the window.
-        self.move_x = None
-        self.move_y = None
-
-    # Create your GUI for the InfoWindow.
-    def create_widgets(self):
-        info_label = tk.Label(self, text='This program outputs a Library of Congress Cutter Number based on the'
-                                         ' LC Cutter Table. Current as of 06/13/2017.')
-        info_label.grid(row=1, sticky='w')
-
-        info_label_two = tk.Label(self, text='\n'
-                                             'Instructions for use:\n'
-                                             '#1 Enter a word in the box provided. '
-                                             '(The cutter appears in the box labeled \"Cutter\".)\n'
-                                             '#2 Highlight the portion of the cutter you want to use.\n'
-                                             '#3 Right-Click the highlighted selection and click copy from the menu.\n'
-                                             'Shortcut: Ctrl+C to copy.'
-                                             , justify='left')
-        info_label_two.grid(row=2, sticky='w')
-
-        about_label = tk.Label(self, text='Copyright 2023 by Joseph Alway')
-        about_label.grid(row=2, sticky='es')
-
-        # Key Bindings for moving the window. Binds to the window.
-        self.bind("<ButtonPress-1>", self.start_move)
-        self.bind("<ButtonRelease-1>", self.stop_move)
-        self.bind("<B1-Motion>", self.on_move)
-
-    # Start position for Moving the Window
-    def start_move(self, event):
-        self.move_x = event.x
-        self.move_y = event.y
-
-    # Stop position for Moving the Window
-    def stop_move(self, event):
-        self.move_x = None
-        self.move_y = None
-
-    # Move the Window.
-    def on_move(self, event):
-        delta_x = event.x - self.move_x
-        delta_y = event.y - self.move_y
-        x = self.winfo_x() + delta_x
-        y = self.winfo_y() + delta_y
-        self.geometry("+%s+%s" % (x, y))
-        return
-
-
-class LCCutter:
-    def __init__(self, new_word):
-        # Initialize variables
-        self.word = new_word.lower()
-
-    def get_cutter(self):
-        # Check the first letter(s) of the cutter word.
-        word_length = len(self.word)
-        if word_length < 2:
-            return "Use at least 2 letters."
-        first_letter = self.word[0]
-        second_letter = self.word[1]
-
-        my_cutter = "." + first_letter
-        # Determine the correct cutter based on the first letter(s)
-        # Based on the LC Cutter Table as of 06/13/2017
-        if first_letter in "aeiouy":
-            if second_letter in "abc":
-                my_cutter = my_cutter + "2"
-            elif second_letter in "defghijk":
-                my_cutter = my_cutter + "3"
-            elif second_letter in "lm":
-                my_cutter = my_cutter + "4"
-            elif second_letter in "no":
-                my_cutter = my_cutter + "5"
-            elif second_letter in "pq":
-                my_cutter = my_cutter + "6"
-            elif second_letter == "r":
-                my_cutter = my_cutter + "7"
-            elif second_letter in "st":
-                my_cutter = my_cutter + "8"
-            elif second_letter in "uvwxyz":
-                my_cutter = my_cutter + "9"
-            else:
-                pass
-        elif first_letter.lower() in "bcdfghjklmnprtuvwxz":
-            if second_letter in "abcd":
-                my_cutter = my_cutter + "3"
-            elif second_letter in "efgh":
-                my_cutter = my_cutter + "4"
-            elif second_letter in "ijklmn":
-                my_cutter = my_cutter + "5"
-            elif second_letter in "opq":
-                my_cutter = my_cutter + "6"
-            elif second_letter in "rst":
-                my_cutter = my_cutter + "7"
-            elif second_letter in "uvwx":
-                my_cutter = my_cutter + "8"
-            elif second_letter in "yz":
-                my_cutter = my_cutter + "9"
-            else:
-                pass
-        elif first_letter.lower() == "s":
-            if second_letter in "ab":
-                my_cutter = my_cutter + "2"
-            elif second_letter == "c":
-                if word_length < 3:
-                    my_cutter = my_cutter + "3"
-                else:
-                    third_letter = self.word[2]
-                    if third_letter in "abcdefg":
-                        my_cutter = my_cutter + "2"
-                    elif third_letter in "hijklmnopqrstuvwxyz":
-                        my_cutter = my_cutter + "3"
-            elif second_letter == "d":
-                my_cutter = my_cutter + "3"
-            elif second_letter in "efg":
-                my_cutter = my_cutter + "4"
-            elif second_letter in "hijkl":
-                my_cutter = my_cutter + "5"
-            elif second_letter in "mnopqrs":
-                my_cutter = my_cutter + "6"
-            elif second_letter == "t":
-                my_cutter = my_cutter + "7"
-            elif second_letter in "uv":
-                my_cutter = my_cutter + "8"
-            elif second_letter in "wxyz":
-                my_cutter = my_cutter + "9"
-            else:
-                pass
-        elif first_letter.lower() == "q":
-            my_dict = {}
-            num_start = 2
-            for letter in "abcdefghijklmnopqrst":
-                my_dict[letter] = num_start
-                num_start += 1
-            if second_letter in "abcdefghijklmnopqrst":
-                my_cutter = my_cutter + str(my_dict[second_letter])
-            elif second_letter in "uvwxyz":
-                if word_length < 3:
-                    if second_letter in "uvwx":
-                        my_cutter = my_cutter + "8"
-                    elif second_letter in "yz":
-                        my_cutter = my_cutter + "9"
-                else:
-                    third_letter = self.word[2]
-                    if third_letter in "abcd":
-                        my_cutter = my_cutter + "3"
-                    elif third_letter in "efgh":
-                        my_cutter = my_cutter + "4"
-                    elif third_letter in "ijklmn":
-                        my_cutter = my_cutter + "5"
-                    elif third_letter in "opq":
-                        my_cutter = my_cutter + "6"
-                    elif third_letter in "rs":
-                        my_cutter = my_cutter + "7"
-                    elif third_letter in "tuvwx":
-                        my_cutter = my_cutter + "8"
-                    elif third_letter in "yz":
-                        my_cutter = my_cutter + "9"
-        else:
-            pass
-        # Cutter Expansion.
-        if self.word[:2] == "qu":
-            my_string = self.word[3:]
-        else:
-            my_string = self.word[2:]
-        for char in my_string:
-            if char in "abcd":
-                my_cutter = my_cutter + "3"
-            elif char in "efgh":
-                my_cutter = my_cutter + "4"
-            elif char in "ijkl":
-                my_cutter = my_cutter + "5"
-            elif char in "mno":
-                my_cutter = my_cutter + "6"
-            elif char in "pqrs":
-                my_cutter = my_cutter + "7"
-            elif char in "tv":
-                my_cutter = my_cutter + "8"
-            elif char in "wxyz":
-                my_cutter = my_cutter + "9"
-            elif char in "u":
-                my_cutter = my_cutter + "u"
-            else:
-                pass
-        # Cutters shouldn't end in 1 or 0.
-        if my_cutter[-1:] in "01":
-            my_cutter = my_cutter + str(random.randrange(2, 9))
-        return my_cutter.upper()
-
-
-# Center the window specified.
-def center(win):
-    """
-    centers a tkinter window
-    :param win: the root or Toplevel window to center
-    """
-    win.update_idletasks()
-    width = win.winfo_width()
-    frm_width = win.winfo_rootx() - win.winfo_x()
-    win_width = width + 2 * frm_width
-    height = win.winfo_height()
-    titlebar_height = win.winfo_rooty() - win.winfo_y()
-    win_height = height + titlebar_height + frm_width
-    x = win.winfo_screenwidth() // 2 - win_width // 2
-    y = win.winfo_screenheight() // 2 - win_height // 2
-    win.geometry('{}x{}+{}+{}'.format(width, height, x, y))
-    win.deiconify()
-
-
-root = tk.Tk()
-# Hide the root window, so it doesn't show up until we've centered it in the MainWindow.
-root.attributes('-alpha', 0.0)
-# Create an instance of our MainWindow Class.
-app = MainWindow(root)
-# Set the title of the root window / MainWindow.
-root.title('LC Cutter Generator v.1.0.5')
-# Set the icon of the root window.
-root.iconbitmap(resource_path('my_icon_lettered_new.ico'))
-root.mainloop()
+"""
+LCCutter is released under "The MIT License (MIT)"
+
+Copyright © 2023 Joseph Alway
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and 
+associated documentation files (the “Software”), to deal in the Software without restriction,
+including without limitation the rights to use, copy, modify, merge, publish, distribute, 
+sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished 
+to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or 
+substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+
+import sys
+
+import cutter_tables
+
+
+"""
+This program should determine the correct alpha-numeric for a given word used as a Cutter in LC Classification.
+Based off the Cutter table available from the Library of Congress website.
+
+Importing this module is safe on machines without a display: tkinter is only imported when the GUI is started.
+Run it without arguments to open the GUI, or use the batch sub-command to cutter words from files or stdin:
+
+    python LCCutter.py batch headings.txt -o cutters.txt
+"""
+
+
+class _DeleteMissing(dict):
+    """ A str.translate table that deletes every character it has no entry for. """
+    def __missing__(self, key):
+        return None
+
+
+class CutterEngine:
+    """
+    A cutter table compiled to lookup structures. The rules themselves are data, see cutter_tables.py.
+    A cutter is then one or two dict lookups plus one str.translate call, instead of a chain of if/elif checks.
+    """
+    def __init__(self, compiled):
+        """ :param compiled: a table compiled by cutter_tables.load_table """
+        # The table's version; cached cutters are keyed by it.
+        self.version = compiled["version"]
+        # First two letters -> the start of the cutter, e.g. "sm" -> ".S6".
+        self.heads = compiled["heads"]
+        # Two letter prefixes whose digit depends on the third letter -> the start of the cutter for a two letter word.
+        self.short = compiled["short"]
+        # First three letters -> the start of the cutter, for the prefixes in self.short.
+        self.third = compiled["third"]
+        # Prefixes whose third letter is used for the digit and is not expanded.
+        self.skip_third = frozenset(compiled["skip_third"])
+        self.expansion = _DeleteMissing(compiled["expansion"])
+
+    def cutter(self, word):
+        """
+        Return the cutter of a lower case word with at least two characters.
+        The result may still end in 0 or 1, resolve_cutter takes care of that.
+        """
+        prefix = word[:2]
+        head = self.heads.get(prefix)
+        if head is None:
+            if prefix not in self.short:
+                return "." + word[0].upper() + word[2:].translate(self.expansion)
+            if len(word) < 3:
+                return self.short[prefix]
+            head = self.third.get(word[:3]) or "." + word[0].upper()
+            if prefix in self.skip_third:
+                return head + word[3:].translate(self.expansion)
+        return head + word[2:].translate(self.expansion)
+
+
+# Engines by table name or path. Tables are loaded on first use, and several can be in use at once.
+_ENGINES = {}
+
+
+def get_engine(table=None):
+    """
+    Return the engine for a cutter table, loading it the first time it's asked for.
+    :param table: a table name or path, see cutter_tables.table_path; None for cutter_tables.DEFAULT_TABLE
+    """
+    engine = _ENGINES.get(table)
+    if engine is None:
+        engine = _ENGINES[table] = CutterEngine(cutter_tables.load_table(table))
+    return engine
+
+
+_ENGINE = get_engine()
+# Cached cutters are keyed by the table version, see cutter_cache.py.
+TABLE_VERSION = _ENGINE.version
+
+
+# Digits tried in order when a cutter ends in 0 or 1, or is already on the shelves.
+SUFFIX_DIGITS = "2345678"
+# What get_cutter returns instead of a cutter for a word with fewer than two letters.
+SHORT_WORD = "Use at least 2 letters."
+
+
+def next_free_cutter(cutter, shelflist):
+    """
+    Return cutter if it's free, otherwise the first free cutter made by adding SUFFIX_DIGITS to it, trying one more
+    digit at a time. The suffix keeps it filing right after the cutter it extends. Cutters ending in 0 or 1 are never
+    free. The shelflist is not changed.
+    :param shelflist: any object with __contains__(cutter), e.g. shelflist.Shelflist or cutter_index.CutterIndex
+    """
+    if cutter[-1] not in "01" and cutter not in shelflist:
+        return cutter
+    bases = [cutter]
+    while True:
+        longer = []
+        for base in bases:
+            for digit in SUFFIX_DIGITS:
+                candidate = base + digit
+                if candidate not in shelflist:
+                    return candidate
+                longer.append(candidate)
+        bases = longer
+
+
+def resolve_cutter(cutter, shelflist=None):
+    """
+    Cutters shouldn't end in 1 or 0, and shouldn't be a number that's already on the shelves.
+    Without a shelflist, a cutter ending in 0 or 1 always gets the first of SUFFIX_DIGITS, so the same word gives the
+    same cutter on every run. With a shelflist, the cutter becomes next_free_cutter(cutter, shelflist), and is added
+    to the shelflist so later words in the same run can't be given it again.
+    :param shelflist: any object with __contains__(cutter) and add(cutter), e.g. shelflist.Shelflist
+    """
+    if shelflist is None:
+        if cutter[-1] in "01":
+            return cutter + SUFFIX_DIGITS[0]
+        return cutter
+    cutter = next_free_cutter(cutter, shelflist)
+    shelflist.add(cutter)
+    return cutter
+
+
+_normalize = None
+
+
+def _fold(word):
+    """
+    Fold diacritics and special letters to the letters the table knows, e.g. "Émile" to "Emile", see normalize.py.
+    normalize is imported on first use, so runs that only see ASCII never load it.
+    """
+    global _normalize
+    if _normalize is None:
+        import normalize
+        _normalize = normalize
+    return _normalize.fold(word)
+
+
+def normalize_word(word):
+    """ Return a word the way the cutter table reads it: diacritics folded, see _fold, and lower case. """
+    if not word.isascii():
+        word = _fold(word)
+    return word.lower()
+
+
+def lookup_cutter(word, engine=_ENGINE):
+    """
+    Return the table cutter of a word from normalize_word, or SHORT_WORD. It may still end in 0 or 1 or be in use,
+    resolve_cutter takes care of that.
+    """
+    if len(word) < 2:
+        return SHORT_WORD
+    return engine.cutter(word)
+
+
+def get_cutter(word, shelflist=None, table=None):
+    """
+    Return the cutter for a word. The same as LCCutter(word).get_cutter(), without creating an object.
+    It's the three steps normalize_word, lookup_cutter and resolve_cutter.
+    :param shelflist: the cutters already in use, see resolve_cutter
+    :param table: the cutter table to use, see get_engine (default: the LC table as of 06/13/2017)
+    """
+    cutter = lookup_cutter(normalize_word(word), _ENGINE if table is None else get_engine(table))
+    if cutter is SHORT_WORD:
+        return cutter
+    return resolve_cutter(cutter, shelflist)
+
+
+class LCCutter:
+    def __init__(self, new_word):
+        # Initialize variables
+        self.word = new_word.lower()
+
+    def get_cutter(self, shelflist=None, table=None):
+        # Based on the LC Cutter Table as of 06/13/2017 unless another table is given, see cutter_tables.py.
+        return get_cutter(self.word, shelflist, table)
+
+
+class IncrementalCutter:
+    """
+    Keeps the cutter of the last word, so the next word only costs the characters that changed.
+    Typing or deleting one character at the end of the word is O(1): after the first two letters (three for "sc" and
+    "qu" to "qz") every character adds its own expansion digit, independent of the others.
+    """
+    def __init__(self, table=None):
+        """ :param table: the cutter table to use, see get_engine """
+        self.engine = get_engine(table)
+        self.word = ""
+        # The cutter of the letters that pick the digit, e.g. ".S6" for "sm", and the expansion of each later letter.
+        self.base = ""
+        self.pieces = []
+        self.expansion = ""
+
+    def update(self, word):
+        """ Return get_cutter(word), reusing the work done for the previous word. """
+        word = normalize_word(word)
+        old_word = self.word
+        self.word = word
+        if len(word) < 2:
+            self.base = ""
+            return SHORT_WORD
+        fixed = 3 if word[:2] in self.engine.short else 2
+        if word.startswith(old_word):
+            common = len(old_word)
+        elif old_word.startswith(word):
+            common = len(word)
+        else:
+            common = 0
+            for old_char, char in zip(old_word, word):
+                if old_char != char:
+                    break
+                common += 1
+        if not self.base or common < fixed or len(word) < fixed:
+            # The letters that pick the digit changed, start over.
+            self.base = self.engine.cutter(word[:fixed])
+            self.pieces = []
+            self.expansion = ""
+            common = min(len(word), fixed)
+        else:
+            removed = len(old_word) - common
+            if removed:
+                removed_length = sum(len(piece) for piece in self.pieces[-removed:])
+                del self.pieces[-removed:]
+                self.expansion = self.expansion[:len(self.expansion) - removed_length]
+        for char in word[common:]:
+            piece = char.translate(self.engine.expansion)
+            self.pieces.append(piece)
+            self.expansion += piece
+        return resolve_cutter(self.base + self.expansion)
+
+
+# Words are cuttered in blocks of this many rows, so the temporary matrices stay small for any input size.
+_VECTOR_BLOCK = 65536
+# Longer words go to get_cutter, so one long heading can't widen the matrices of its whole block.
+VECTOR_WIDTH = 64
+# A block of get_cutters results with a cutter longer than this is kept as Python strings, for the same reason. The
+# cutter of a word up to VECTOR_WIDTH characters long is always shorter.
+_OBJECT_WIDTH = 2 * VECTOR_WIDTH
+
+
+def _vector_tables(engine, np):
+    """ Build the NumPy versions of the engine tables once and keep them on the engine. """
+    tables = getattr(engine, "_vector_tables", None)
+    if tables is not None:
+        return tables
+    # The longest cutter head in the table, e.g. ".Q21", and at least "." and the initial letter.
+    head_width = max([len(value) for values in (engine.heads, engine.short, engine.third) for value in values.values()]
+                     + [2])
+    # head[a, b] is the cutter head for a word starting with the ASCII codes a, b, padded with zeros.
+    head = np.zeros((128, 128, head_width), dtype=np.uint8)
+    for first in range(128):
+        start = ("." + chr(first).upper()).encode("ascii")
+        head[first, :, :len(start)] = np.frombuffer(start, dtype=np.uint8)
+    for prefix, value in engine.heads.items():
+        head[ord(prefix[0]), ord(prefix[1]), :] = 0
+        head[ord(prefix[0]), ord(prefix[1]), :len(value)] = np.frombuffer(value.encode("ascii"), dtype=np.uint8)
+    # special[a, b] is the row in short / third for prefixes that depend on the third letter, otherwise -1.
+    special = np.full((128, 128), -1, dtype=np.int16)
+    short = np.zeros((len(engine.short), head_width), dtype=np.uint8)
+    third = np.zeros((len(engine.short), 128, head_width), dtype=np.uint8)
+    skip_third = np.zeros(len(engine.short), dtype=bool)
+    for row, (prefix, value) in enumerate(sorted(engine.short.items())):
+        special[ord(prefix[0]), ord(prefix[1])] = row
+        short[row, :len(value)] = np.frombuffer(value.encode("ascii"), dtype=np.uint8)
+        third[row] = head[ord(prefix[0]), ord(prefix[1])]
+        for letter in range(128):
+            value = engine.third.get(prefix + chr(letter))
+            if value is not None:
+                third[row, letter, :] = 0
+                third[row, letter, :len(value)] = np.frombuffer(value.encode("ascii"), dtype=np.uint8)
+        skip_third[row] = prefix in engine.skip_third
+    # expansion[c] is the character added for the ASCII code c, or 0 when it is dropped.
+    expansion = np.zeros(128, dtype=np.uint8)
+    for code, value in engine.expansion.items():
+        expansion[code] = ord(value)
+    tables = (head, special, short, third, skip_third, expansion)
+    engine._vector_tables = tables
+    return tables
+
+
+def _vector_block(words, engine, np):
+    """ Cutter one block of words. Returns the cutters as a NumPy byte string array and the rows left to get_cutter. """
+    head, special, short, third, skip_third, expansion = _vector_tables(engine, np)
+    # A "U" array stores each word as zero padded UCS4 code points, so it can be viewed as an integer matrix. Words
+    # longer than VECTOR_WIDTH are blanked first, which sends them to get_cutter with the other short words.
+    if isinstance(words, np.ndarray):
+        text = words
+        if text.dtype.itemsize > 4 * VECTOR_WIDTH:
+            too_long = np.char.str_len(text) > VECTOR_WIDTH
+            text = text.astype("U%d" % VECTOR_WIDTH)
+            text[too_long] = ""
+    elif max(map(len, words), default=0) > VECTOR_WIDTH:
+        text = np.asarray([word if len(word) <= VECTOR_WIDTH else "" for word in words], dtype=np.str_)
+    else:
+        text = np.asarray(words, dtype=np.str_)
+    width = max(text.dtype.itemsize // 4, 3)
+    codes = np.zeros((len(text), width), dtype=np.uint32)
+    if text.dtype.itemsize:
+        codes[:, :text.dtype.itemsize // 4] = text.view(np.uint32).reshape(len(text), -1)
+    lengths = np.count_nonzero(codes, axis=1)
+    # Words with non-ASCII characters can change length when lower cased, get_cutter handles those exactly.
+    scalar = (codes >= 128).any(axis=1) | (lengths < 2)
+    # So do words with NUL characters, which would be taken for padding here. NumPy drops trailing NULs when it
+    # converts a list, so those are looked for in the list itself.
+    scalar |= lengths != np.char.str_len(text)
+    if not isinstance(words, np.ndarray) and "\0" in "".join(words):
+        scalar |= np.array(["\0" in word for word in words])
+    codes[scalar] = 0
+    matrix = codes.astype(np.uint8)
+    upper_case = (matrix >= 65) & (matrix <= 90)
+    matrix[upper_case] += 32
+
+    first = matrix[:, 0]
+    second = matrix[:, 1]
+    heads = head[first, second]
+    rows = special[first, second]
+    special_rows = np.nonzero(rows >= 0)[0]
+    expanded = expansion[matrix[:, 2:]]
+    if len(special_rows):
+        row_ids = rows[special_rows]
+        is_short = lengths[special_rows] < 3
+        heads[special_rows] = np.where(is_short[:, None], short[row_ids], third[row_ids, matrix[special_rows, 2]])
+        # For "qu" the third letter picked the digit, so it is not expanded.
+        skipped = special_rows[skip_third[row_ids]]
+        expanded[skipped, 0] = 0
+
+    # Push the dropped characters (zeros) to the end of each row, keeping the order of the others.
+    spread = np.concatenate([heads, expanded], axis=1)
+    kept_rows, kept_columns = np.nonzero(spread)
+    positions = np.cumsum(spread != 0, axis=1) - 1
+    cutters = np.zeros_like(spread)
+    cutters[kept_rows, positions[kept_rows, kept_columns]] = spread[kept_rows, kept_columns]
+    # Cutters shouldn't end in 1 or 0, get_cutter adds the extra digit.
+    last = cutters[np.arange(len(cutters)), np.count_nonzero(cutters, axis=1) - 1]
+    scalar |= (last == ord("0")) | (last == ord("1"))
+    return cutters.view("S%d" % cutters.shape[1]).ravel(), np.nonzero(scalar)[0]
+
+
+def get_cutters(words, table=None):
+    """
+    Return the cutters for a list of words as a NumPy string array, in the same order.
+    Each result is the same as get_cutter(word), but the table lookups run on whole blocks of words at once.
+    A NumPy string array is as wide as its longest string, so when a cutter is longer than 2 * VECTOR_WIDTH
+    characters, which takes a heading about that long, the result is an object array of Python strings instead.
+    Collisions with a shelflist are not checked here, use get_cutter with a shelflist for that.
+    Needs NumPy.
+    :param words: a list, tuple or NumPy array of words
+    :param table: the cutter table to use, see get_engine
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("get_cutters needs NumPy. Install it, or call get_cutter for each word instead.")
+    engine = get_engine(table)
+    if isinstance(words, np.ndarray) and words.dtype.kind != "U":
+        words = words.tolist()
+    elif not isinstance(words, (list, tuple, np.ndarray)):
+        words = list(words)
+    blocks = []
+    for start in range(0, len(words), _VECTOR_BLOCK):
+        block = words[start:start + _VECTOR_BLOCK]
+        cutters, scalar = _vector_block(block, engine, np)
+        cutters = cutters.astype(np.str_)
+        if len(scalar):
+            others = [get_cutter(str(block[row]), None, table) for row in scalar]
+            longest = max(map(len, others))
+            if longest > _OBJECT_WIDTH:
+                cutters = cutters.astype(object)
+            elif longest > cutters.dtype.itemsize // 4:
+                cutters = cutters.astype("U%d" % longest)
+            cutters[scalar] = others
+        blocks.append(cutters)
+    if not blocks:
+        return np.array([], dtype=np.str_)
+    if any(cutters.dtype == object for cutters in blocks):
+        blocks = [cutters.astype(object) for cutters in blocks]
+    return np.concatenate(blocks)
+
+
+# Batch mode. Each stage is a generator, so only one line is held in memory at a time no matter how large the input.
+def read_words(files=None, encoding="utf-8"):
+    """
+    Yield one word per input line.
+    :param files: paths to read in order, or None / "-" for stdin
+    :param encoding: text encoding of the input files
+    """
+    if not files:
+        files = ["-"]
+    for path in files:
+        if path == "-":
+            for line in sys.stdin:
+                yield line.strip(" \t\r\n")
+        else:
+            with open(path, encoding=encoding) as in_file:
+                for line in in_file:
+                    yield line.strip(" \t\r\n")
+
+
+def iter_cutters(words, with_word=False, shelflist=None, filing=None, table=None):
+    """
+    Yield one output line per word.
+    :param words: an iterable of words
+    :param with_word: prefix each cutter with the word and a tab
+    :param shelflist: the cutters already in use, see resolve_cutter
+    :param filing: a function giving the text to cutter for each word, e.g. title_cutter.filing_function()
+    :param table: the cutter table to use, see get_engine
+    """
+    if filing is not None:
+        for word in words:
+            cutter = get_cutter(filing(word), shelflist, table)
+            yield word + "\t" + cutter + "\n" if with_word else cutter + "\n"
+    elif with_word:
+        for word in words:
+            yield word + "\t" + get_cutter(word, shelflist, table) + "\n"
+    else:
+        for word in words:
+            yield get_cutter(word, shelflist, table) + "\n"
+
+
+def write_lines(lines, output=None, encoding="utf-8"):
+    """
+    Write lines to the output path, or stdout when output is None or "-".
+    :return: the number of lines written
+    """
+    count = 0
+    if output is None or output == "-":
+        out_file = sys.stdout
+    else:
+        out_file = open(output, "w", encoding=encoding)
+    try:
+        for line in lines:
+            out_file.write(line)
+            count += 1
+    finally:
+        if out_file is not sys.stdout:
+            out_file.close()
+    return count
+
+
+def batch(files=None, output=None, with_word=False, encoding="utf-8", shelflist=None, filing=None, table=None):
+    """ Cutter every line of the input files and write the cutters in the same order. """
+    return write_lines(iter_cutters(read_words(files, encoding), with_word, shelflist, filing, table), output,
+                       encoding)
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    # No arguments opens the GUI, the same as before batch mode existed.
+    if not argv or argv[0] == "gui":
+        import LCCutterGUI
+        LCCutterGUI.main()
+        return 0
+
+    # argparse is only needed on the command line, so keep it out of the import path.
+    import argparse
+    parser = argparse.ArgumentParser(prog="LCCutter", description="Library of Congress Cutter Number generator.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("gui", help="open the GUI (the default when no arguments are given)")
+    batch_parser = subparsers.add_parser("batch", help="cutter one word per line from files or stdin")
+    batch_parser.add_argument("files", nargs="*", help="input files (default: stdin, or use -)")
+    batch_parser.add_argument("-o", "--output", default=None, help="output file (default: stdout)")
+    batch_parser.add_argument("--with-word", action="store_true", help="write the word and a tab before each cutter")
+    batch_parser.add_argument("--encoding", default="utf-8", help="encoding of the input and output files")
+    batch_parser.add_argument("-j", "--workers", type=int, default=1,
+                              help="number of worker processes, 0 for one per CPU (default: 1)")
+    batch_parser.add_argument("--chunk-size", type=int, default=4 * 1024 * 1024,
+                              help="bytes of input per chunk handed to a worker (default: 4 MiB)")
+    batch_parser.add_argument("--bytes", action="store_true",
+                              help="bytes-native mode for ASCII / Latin-1 files; same output, less work per line")
+    batch_parser.add_argument("--shelflist", default=None,
+                              help="file of call numbers already on the shelves, one per line; new cutters won't "
+                                   "repeat the cutters filed under --class")
+    batch_parser.add_argument("--index", default=None,
+                              help="cutter index built with the index command; new cutters won't repeat its cutters "
+                                   "filed under --class")
+    batch_parser.add_argument("--class", dest="class_number", default=None,
+                              help="class number the new cutters will file under, e.g. PS3545; needed with "
+                                   "--shelflist or --index when they hold full call numbers")
+    batch_parser.add_argument("--record", action="store_true",
+                              help="add the new cutters to the --index delta segment")
+    batch_parser.add_argument("--titles", action="store_true",
+                              help="lines are titles or corporate names: skip initial articles and punctuation")
+    batch_parser.add_argument("--languages", default=None,
+                              help="comma separated article languages for --titles, or \"all\" (default: english, "
+                                   "see title_cutter.py)")
+    batch_parser.add_argument("--table", default=None,
+                              help="cutter table: a name from the tables directory or a path to a table file "
+                                   "(default: %s)" % cutter_tables.DEFAULT_TABLE)
+    batch_parser.add_argument("--cache", default=None,
+                              help="SQLite cutter cache; headings cuttered in earlier runs are not recomputed")
+    batch_parser.add_argument("--cache-size", type=int, default=10000000,
+                              help="most cutters kept in the --cache file (default: 10000000)")
+    batch_parser.add_argument("--only-new", action="store_true",
+                              help="with --cache, only write lines for headings that were not in the cache")
+    batch_parser.add_argument("--metrics", default=None,
+                              help="time every stage of the run and write the metrics to this file")
+    batch_parser.add_argument("--metrics-format", choices=("prometheus", "json"), default="prometheus",
+                              help="format of the --metrics file (default: prometheus)")
+    batch_parser.add_argument("--profile-sample", type=int, default=0, metavar="N",
+                              help="with --metrics, run every Nth record under cProfile and write the stats to "
+                                   "the --metrics file name plus .prof")
+    index_parser = subparsers.add_parser("index", help="build a cutter index from a call number export")
+    index_parser.add_argument("export", help='export file, one "record id<TAB>call number" or call number per line')
+    index_parser.add_argument("-o", "--output", required=True, help="index file to write")
+    index_parser.add_argument("--encoding", default="utf-8", help="encoding of the export file")
+    sort_parser = subparsers.add_parser("sort", help="sort call numbers, one per line, into shelf order")
+    sort_parser.add_argument("files", nargs="*", help="input files (default: stdin, or use -)")
+    sort_parser.add_argument("-o", "--output", default=None, help="output file (default: stdout)")
+    sort_parser.add_argument("--encoding", default="utf-8", help="encoding of the input and output files")
+    sort_parser.add_argument("--chunk-lines", type=int, default=1000000,
+                             help="lines sorted in memory at a time; larger inputs are merged from temporary files "
+                                  "(default: 1000000)")
+    sort_parser.add_argument("--temp-dir", default=None, help="directory for the temporary files")
+    ranges_parser = subparsers.add_parser("ranges", help="list the headings in a cutter range, or around a cutter")
+    ranges_parser.add_argument("headings", help='file of headings, one per line, or "heading<TAB>cutter" lines')
+    ranges_parser.add_argument("--from", dest="low", default=None, metavar="CUTTER", help="first cutter of the range")
+    ranges_parser.add_argument("--to", dest="high", default=None, metavar="CUTTER",
+                               help="last cutter of the range, with the cutters that extend it (default: --from)")
+    ranges_parser.add_argument("--nearest", default=None, metavar="CUTTER",
+                               help="list the headings just before and after where this cutter files")
+    ranges_parser.add_argument("--count", type=int, default=5, help="headings on each side for --nearest")
+    ranges_parser.add_argument("--encoding", default="utf-8", help="encoding of the headings file and the output")
+    ranges_parser.add_argument("--table", default=None, help="cutter table for headings without a cutter")
+    serve_parser = subparsers.add_parser("serve", help="run the local HTTP/JSON cutter service")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    serve_parser.add_argument("--port", type=int, default=8080, help="port to listen on (default: 8080)")
+    serve_parser.add_argument("--max-batch", type=int, default=256, help="most requests answered together")
+    serve_parser.add_argument("--max-delay", type=float, default=0.5,
+                              help="milliseconds to wait for a batch to fill (default: 0.5)")
+    serve_parser.add_argument("--cache-size", type=int, default=100000, help="words kept in the LRU cache")
+    args = parser.parse_args(argv)
+
+    filing = None
+    if args.command == "batch":
+        try:
+            get_engine(args.table)
+        except (OSError, ValueError) as error:
+            parser.error("can't load --table: %s" % error)
+    if args.command == "batch" and args.titles:
+        import title_cutter
+        languages = title_cutter.DEFAULT_LANGUAGES
+        if args.languages and args.languages.strip().lower() == "all":
+            languages = None
+        elif args.languages:
+            languages = tuple(language.strip().lower() for language in args.languages.split(","))
+            unknown = [language for language in languages if language not in title_cutter.ARTICLES]
+            if unknown:
+                parser.error("unknown --languages: %s" % ", ".join(unknown))
+        filing = title_cutter.filing_function(languages)
+
+    if args.command == "batch":
+        if args.workers < 0:
+            parser.error("--workers can't be negative, use 0 for one per CPU")
+        if args.chunk_size < 1:
+            parser.error("--chunk-size has to be at least 1")
+        if args.metrics and (args.workers != 1 or args.bytes or args.cache):
+            parser.error("--metrics can't be used with --workers, --bytes or --cache")
+        if args.profile_sample and not args.metrics:
+            parser.error("--profile-sample needs --metrics")
+        if args.workers != 1:
+            if not args.files or "-" in args.files:
+                parser.error("--workers needs input files, stdin can't be split into chunks")
+            if args.shelflist or args.index:
+                parser.error("--shelflist and --index can't be used with --workers, every cutter has to be checked "
+                             "in order")
+            if args.bytes or args.cache:
+                parser.error("--bytes and --cache can't be used with --workers")
+            import parallel_batch
+            parallel_batch.parallel_batch(args.files, args.output, args.workers or None, args.chunk_size,
+                                          args.with_word, args.encoding, filing=filing, table=args.table)
+        else:
+            shelflist = None
+            if args.bytes:
+                if args.shelflist or args.index or args.cache or args.titles:
+                    parser.error("--bytes can't be used with --shelflist, --index, --cache or --titles")
+                import bytes_batch
+                bytes_batch.bytes_batch(args.files, args.output, args.with_word, args.encoding, table=args.table)
+                return 0
+            if args.shelflist and args.index:
+                parser.error("use either --shelflist or --index")
+            if args.shelflist:
+                from shelflist import Shelflist
+                shelflist = Shelflist.load(args.shelflist, args.encoding)
+            elif args.index:
+                from cutter_index import CutterIndex
+                shelflist = CutterIndex(args.index, writable=args.record)
+            index = shelflist if args.index else None
+            if shelflist is not None:
+                # A cutter is only taken within its own class number, so check against the one the cutters file under.
+                if args.class_number:
+                    from shelflist import ClassShelflist
+                    shelflist = ClassShelflist(shelflist, args.class_number)
+                elif shelflist.has_class_numbers():
+                    if index is not None:
+                        index.close()
+                    parser.error("--shelflist and --index hold call numbers with class numbers, use --class to give "
+                                 "the one the new cutters file under")
+            elif args.class_number:
+                parser.error("--class needs --shelflist or --index")
+            try:
+                if args.cache:
+                    from cutter_cache import CutterCache
+                    with CutterCache(args.cache, args.cache_size, args.table) as cache:
+                        lines = cache.iter_cutters(read_words(args.files, args.encoding), args.with_word, shelflist,
+                                                   args.only_new, filing)
+                        write_lines(lines, args.output, args.encoding)
+                        sys.stderr.write(cache.report() + "\n")
+                elif args.metrics:
+                    # Only load the timed pipeline when it's asked for, so the normal one has no instrumentation.
+                    import cutter_metrics
+                    metrics = cutter_metrics.Metrics(args.profile_sample)
+                    cutter_metrics.batch(args.files, args.output, args.with_word, args.encoding, shelflist, filing,
+                                         args.table, metrics)
+                    metrics.write(args.metrics, args.metrics_format)
+                    if metrics.profiler is not None:
+                        metrics.profiler.dump_stats(args.metrics + ".prof")
+                else:
+                    batch(args.files, args.output, args.with_word, args.encoding, shelflist, filing, args.table)
+            finally:
+                if index is not None:
+                    index.close()
+    elif args.command == "index":
+        from cutter_index import CutterIndex, read_export
+        CutterIndex.build(args.output, read_export(args.export, args.encoding)).close()
+    elif args.command == "sort":
+        if args.chunk_lines < 1:
+            parser.error("--chunk-lines has to be at least 1")
+        import shelf_sort
+        shelf_sort.shelf_sort(args.files, args.output, args.encoding, args.chunk_lines, args.temp_dir)
+    elif args.command == "ranges":
+        if (args.low is None) == (args.nearest is None):
+            parser.error("use either --from (and --to) or --nearest")
+        from shelf_sort import cutter_key
+        for cutter in (args.low, args.high, args.nearest):
+            try:
+                if cutter is not None:
+                    cutter_key(cutter)
+            except ValueError as error:
+                parser.error(str(error))
+        from cutter_ranges import CutterRanges
+        ranges = CutterRanges.load(args.headings, args.encoding, args.table)
+        if args.nearest:
+            before, after = ranges.nearest(args.nearest, args.count)
+            lines = ["%s\t%s\n" % entry for entry in before] + ["-- %s\n" % args.nearest]
+            lines += ["%s\t%s\n" % entry for entry in after]
+        else:
+            lines = ("%s\t%s\n" % entry for entry in ranges.range(args.low, args.high))
+        write_lines(lines, None, args.encoding)
+    elif args.command == "serve":
+        import cutter_service
+        cutter_service.serve(args.host, args.port, max_batch=args.max_batch, max_delay=args.max_delay / 1000.0,
+                             cache_size=args.cache_size)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
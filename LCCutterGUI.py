@@ -0,0 +1,606 @@
+"""
+LCCutter is released under "The MIT License (MIT)"
+
+Copyright © 2023 Joseph Alway
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and 
+associated documentation files (the “Software”), to deal in the Software without restriction,
+including without limitation the rights to use, copy, modify, merge, publish, distribute, 
+sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished 
+to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or 
+substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+
+import tkinter as tk
+import os
+import queue
+import sys
+import threading
+from tkinter import filedialog, ttk
+
+from LCCutter import IncrementalCutter
+
+
+"""
+The Tk front end for LCCutter. The cutter logic itself lives in LCCutter.py, which can be imported without a display.
+"""
+
+
+def resource_path(relative_path):
+    """ Get absolute path to resource, works for dev and for PyInstaller """
+    try:
+        # PyInstaller creates a temp folder and stores path in _MEIPASS
+        base_path = sys._MEIPASS
+    except Exception:
+        base_path = os.path.abspath(".")
+
+    return os.path.join(base_path, relative_path)
+
+
+class MainWindow(tk.Frame):
+    def __init__(self, master):
+        tk.Frame.__init__(self, master)
+        self.grid(sticky="ew")
+        self.create_widgets()
+        self.create_menus()
+        self.focus_force()
+        self.my_window = None
+        self.range_window = None
+        self.bulk_window = None
+        self.my_word = None
+        # Cutters are worked out from the previous word, and the display is only redrawn when Tk is idle.
+        self.incremental_cutter = IncrementalCutter()
+        self.bad_key = False
+        self.render_job = None
+        self.shown = ("", None)
+        self.cutter_entry.focus()
+
+        root.resizable(1, 0)
+
+        # root.grid_rowconfigure(0, weight=1)
+        root.grid_columnconfigure(0, weight=1)
+
+        # self.grid_rowconfigure(0, weight=1)
+        # self.grid_columnconfigure(0, weight=1)
+
+        # self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(1, weight=1)
+
+        # self.grid_columnconfigure(2, weight=1)
+        self.cutter_display_text.bind("<Button-3>", self.popup_menu)
+
+        # This binds all keys to the cutter entry and runs the new cutter function every time a key is released.
+        # Binding on KeyRelease updates the value of the entry widget, before running the function.
+        # Binding on Key doesn't update the Entry Widget's value until after the function has run.
+        # We want the entry value to include the edit, so we want the Entry widget bound on KeyRelease.
+        # <KeyRelease> fixes an entire workaround that was designed to add the letter of the key press to the label.
+        self.cutter_entry.bind("<KeyRelease>", self.new_cutter)
+
+        # We hid the window as soon as we created the root.
+        # It looks nicer, if you don't see the window being centered.
+        # Center the Window.
+        center(root)
+        # Show the window. Without this, you won't see the window.
+        root.attributes('-alpha', 1.0)
+
+    def copy_to_clipboard(self):
+        try:
+            sel = self.cutter_display_text.get("sel.first", "sel.last")
+            root.clipboard_clear()
+            root.clipboard_append(sel)
+        except tk.TclError:
+            pass
+
+    # Create the GUI for our IntroScreen.
+    def create_widgets(self):
+        self.cutter_entry_label = tk.Label(self, text='Enter a word:')
+        self.cutter_entry_label.grid(sticky="nse")
+
+        self.cutter_entry = tk.Entry(self)
+        self.cutter_entry.config(width=35)
+        self.cutter_entry.grid(row=0, column=1, sticky="nsew")
+
+        # self.cutter_button = tk.Button(self, text="Create Cutter", command=self.new_cutter)
+        # self.cutter_button.grid(row=0, column=2, sticky="nsew")
+
+        self.new_cutter_label = tk.Label(self, text="Cutter:")
+        self.new_cutter_label.grid(row=1, sticky="nse")
+
+        # Use a Disabled Text Widget instead of a Label widget.
+        self.cutter_display_text = tk.Text(self, height=1, width=25, state="disabled")
+        self.cutter_display_text.grid(row=1, column=1, sticky="nsew")
+        self.cutter_display_text.tag_configure("left", justify="left")
+        self.cutter_display_text.tag_configure("color_me_red", foreground="red")
+        self.cutter_display_text.tag_add("left", 1.0, "end")
+
+        self.button = tk.Button(self, text='?', command=self.new_window)
+        self.button.grid(row=1, column=2, sticky="nse")
+
+        self.range_button = tk.Button(self, text='Ranges', command=self.new_range_window)
+        self.range_button.grid(row=0, column=2, sticky="nse")
+
+        self.bulk_button = tk.Button(self, text='Bulk', command=self.new_bulk_window)
+        self.bulk_button.grid(row=0, column=3, sticky="nse")
+
+        # Key Bindings for moving the window. Binds to the window.
+        self.bind("<ButtonPress-1>", self.start_move)
+        self.bind("<ButtonRelease-1>", self.stop_move)
+        self.bind("<B1-Motion>", self.on_move)
+
+    def create_menus(self):
+        self.my_context_menu = tk.Menu(self, tearoff=0)
+        self.my_context_menu.add_command(label="copy", command=self.copy_to_clipboard)
+
+    def popup_menu(self, event):
+        # Enable the copy menu entry, if something is selected in the cutter_display_text widget.
+        # Disable the copy menu entry, if there is nothing selected. Exception is caught, if there's no selection.
+        try:
+            self.cutter_display_text.get("sel.first", "sel.last")
+            self.my_context_menu.entryconfig("copy", state="normal")
+        except tk.TclError:
+            self.my_context_menu.entryconfig("copy", state="disabled")
+        self.my_context_menu.post(event.x_root, event.y_root)
+
+    # This creates one instance of our InfoWindow class.
+    def new_window(self):
+        if self.my_window is None:
+            self.update()
+            x = root.winfo_rootx()
+            y = root.winfo_rooty()
+            height = root.winfo_height()
+            # x, y, and height are in pixels. Add, subtract, divide, etc as needed to place window where you want.
+            geom = "+%d+%d" % (x, y + height)
+            self.my_window = InfoWindow()
+            self.my_window.geometry(geom)
+            # This overrides the normal delete function of a window. Make sure to destroy the related window.
+            self.my_window.wm_protocol("WM_DELETE_WINDOW", self.on_closing)
+            self.my_window.focus()
+        else:
+            self.my_window.focus()
+            pass
+
+    # This creates one instance of our RangeWindow class, starting from the cutter on display.
+    def new_range_window(self):
+        if self.range_window is None:
+            self.range_window = RangeWindow()
+            self.range_window.wm_protocol("WM_DELETE_WINDOW", self.on_range_closing)
+        cutter = self.shown[0] if self.shown[1] is None and self.shown[0].startswith(".") else ""
+        if cutter:
+            self.range_window.low_entry.delete(0, tk.END)
+            self.range_window.low_entry.insert(0, cutter)
+        self.range_window.focus()
+
+    # This creates one instance of our BulkWindow class.
+    def new_bulk_window(self):
+        if self.bulk_window is None:
+            self.bulk_window = BulkWindow()
+            self.bulk_window.wm_protocol("WM_DELETE_WINDOW", self.on_bulk_closing)
+        self.bulk_window.focus()
+
+    # The key word event allows an event to activate the function. Such as a key press.
+    def new_cutter(self, event=None):
+        # Need to Figure out solution for using delete to delete a letter. Current process lets you use it, but
+        # shows an error message when you press delete. Since, the display won't update unless you press another key.
+
+        # Binding the Entry widget to KeyRelease fixed the need for the workaround.
+        # The following if statement is needed to make sure the cutter_display_text is accurate.
+        # if event.char.isalpha():
+        #     This workaround doesn't work, if you are deleting a character.
+        #     You have to call new_cutter twice for the deleted character to disappear in the cutter_display_text.
+        #     self.my_word = self.my_word + event.char
+        #     pass
+        # We want to ignore the BackSpace key press, so we get the cutter instead of an error displayed.
+        # elif event.keysym == 'BackSpace':
+        #     self.my_word = self.my_word[:-1]
+        #     Fool the rest of the logic into thinking a was pressed, so it doesn't give us an error.
+        #     event.char = 'a'
+        # We want to ignore these key presses, so we get the cutter instead of an error displayed.
+        if event.keysym in 'Shift_L,Shift_R,Caps_Lock,Left,Right,Up,Down,Cancel,End,Home,Print,Insert,Escape':
+            # Fool the rest of the logic into thinking a was pressed, so it doesn't give us an error.
+            event.char = 'a'
+        # Check to make sure the character entered is a letter and output an error, if not.
+        self.bad_key = event.char.isalpha() is False and event.keysym != 'Delete' and event.keysym != 'BackSpace'
+        # Holding a key down or pasting a long name sends key events faster than the window redraws.
+        # Only the last one matters, so the display is updated once, when Tk has handled all the waiting events.
+        if self.render_job is None:
+            self.render_job = self.after_idle(self.show_cutter)
+
+    def show_cutter(self):
+        self.render_job = None
+        # Get the word from the cutter_entry widget.
+        self.my_word = self.cutter_entry.get()
+        my_word_length = len(self.my_word)
+        tag = None
+        if self.bad_key:
+            text, tag = "Please only use letters.", "color_me_red"
+        # Insert the word / cutter in the self.cutter_display_text widget.
+        elif my_word_length > 0 and self.my_word.isalpha():
+            text = self.incremental_cutter.update(self.my_word)
+        # Leave the self.cutter_display_text widget clear, if the word length is 0.
+        elif my_word_length == 0:
+            text = ""
+        # Insert an error to cover all other cases. Example, the word containing a number, but a letter was pressed.
+        else:
+            text, tag = "Please only use letters.", "color_me_red"
+        # Leave the widget alone, if nothing changed.
+        if (text, tag) == self.shown:
+            return
+        self.shown = (text, tag)
+        # Clear the self.cutter_display_text widget of text.
+        self.cutter_display_text.configure(state="normal")
+        self.cutter_display_text.delete(1.0, tk.END)
+        if tag:
+            self.cutter_display_text.insert(1.0, text, tag)
+        elif text:
+            self.cutter_display_text.insert(1.0, text)
+        self.cutter_display_text.configure(state="disabled")
+
+    # Run this when we close the child window self.my_window
+    def on_closing(self):
+        # Destroy the child window.
+        self.my_window.destroy()
+        # Set our window variable back to None.
+        self.my_window = None
+        # You could also do anything else here that you want to happen when closing the child window.
+
+    # Run this when we close the child window self.range_window
+    def on_range_closing(self):
+        self.range_window.close()
+        self.range_window = None
+
+    # Run this when we close the child window self.bulk_window. A running job is cancelled.
+    def on_bulk_closing(self):
+        self.bulk_window.close()
+        self.bulk_window = None
+
+    # Start position for Moving the Window
+    def start_move(self, event):
+        self.move_x = event.x
+        self.move_y = event.y
+
+    # Stop position for Moving the Window
+    def stop_move(self, event):
+        self.move_x = None
+        self.move_y = None
+
+    # Move the Window.
+    def on_move(self, event):
+        delta_x = event.x - self.move_x
+        delta_y = event.y - self.move_y
+        x = root.winfo_x() + delta_x
+        y = root.winfo_y() + delta_y
+        root.geometry("+%s+%s" % (x, y))
+        return
+
+
+# Like the frame, or any widget, this inherited from the parent widget
+class InfoWindow(tk.Toplevel):
+    def __init__(self):
+        tk.Toplevel.__init__(self)
+        self.grid()
+        self.create_widgets()
+        self.focus_force()
+        self.wm_attributes('-toolwindow', True)
+        self.title('Information Page')
+        self.resizable(0, 0)
+        # Variables for moving the window.
+        self.move_x = None
+        self.move_y = None
+
+    # Create your GUI for the InfoWindow.
+    def create_widgets(self):
+        info_label = tk.Label(self, text='This program outputs a Library of Congress Cutter Number based on the'
+                                         ' LC Cutter Table. Current as of 06/13/2017.')
+        info_label.grid(row=1, sticky='w')
+
+        info_label_two = tk.Label(self, text='\n'
+                                             'Instructions for use:\n'
+                                             '#1 Enter a word in the box provided. '
+                                             '(The cutter appears in the box labeled \"Cutter\".)\n'
+                                             '#2 Highlight the portion of the cutter you want to use.\n'
+                                             '#3 Right-Click the highlighted selection and click copy from the menu.\n'
+                                             'Shortcut: Ctrl+C to copy.'
+                                             , justify='left')
+        info_label_two.grid(row=2, sticky='w')
+
+        about_label = tk.Label(self, text='Copyright 2023 by Joseph Alway')
+        about_label.grid(row=2, sticky='es')
+
+        # Key Bindings for moving the window. Binds to the window.
+        self.bind("<ButtonPress-1>", self.start_move)
+        self.bind("<ButtonRelease-1>", self.stop_move)
+        self.bind("<B1-Motion>", self.on_move)
+
+    # Start position for Moving the Window
+    def start_move(self, event):
+        self.move_x = event.x
+        self.move_y = event.y
+
+    # Stop position for Moving the Window
+    def stop_move(self, event):
+        self.move_x = None
+        self.move_y = None
+
+    # Move the Window.
+    def on_move(self, event):
+        delta_x = event.x - self.move_x
+        delta_y = event.y - self.move_y
+        x = self.winfo_x() + delta_x
+        y = self.winfo_y() + delta_y
+        self.geometry("+%s+%s" % (x, y))
+        return
+
+
+# Lists the loaded headings in a cutter range, or around the place a cutter files, see cutter_ranges.py.
+class RangeWindow(tk.Toplevel):
+    # Milliseconds between two looks at the queue while headings load.
+    POLL_INTERVAL = 100
+
+    def __init__(self):
+        tk.Toplevel.__init__(self)
+        self.title('Cutter Ranges')
+        self.ranges = None
+        self.messages = queue.Queue()
+        self.worker = None
+        self.poll_job = None
+        self.create_widgets()
+        self.grid_columnconfigure(1, weight=1)
+        self.grid_rowconfigure(4, weight=1)
+
+    def create_widgets(self):
+        self.load_button = tk.Button(self, text='Load headings...', command=self.load_headings)
+        self.load_button.grid(row=0, column=0, sticky="nsew")
+        self.status_label = tk.Label(self, text='No headings loaded.', anchor='w')
+        self.status_label.grid(row=0, column=1, columnspan=2, sticky="nsew")
+
+        tk.Label(self, text='From:').grid(row=1, column=0, sticky="nse")
+        self.low_entry = tk.Entry(self)
+        self.low_entry.grid(row=1, column=1, sticky="nsew")
+        self.find_button = tk.Button(self, text='Range', command=self.show_range)
+        self.find_button.grid(row=1, column=2, sticky="nsew")
+
+        tk.Label(self, text='To:').grid(row=2, column=0, sticky="nse")
+        self.high_entry = tk.Entry(self)
+        self.high_entry.grid(row=2, column=1, sticky="nsew")
+        self.nearest_button = tk.Button(self, text='Nearest', command=self.show_nearest)
+        self.nearest_button.grid(row=2, column=2, sticky="nsew")
+
+        self.results = tk.Listbox(self, width=60, height=20)
+        self.results.grid(row=4, column=0, columnspan=2, sticky="nsew")
+        self.scrollbar = tk.Scrollbar(self, command=self.results.yview)
+        self.scrollbar.grid(row=4, column=2, sticky="nsw")
+        self.results.config(yscrollcommand=self.scrollbar.set)
+        self.low_entry.bind("<Return>", lambda event: self.show_range())
+        self.high_entry.bind("<Return>", lambda event: self.show_range())
+
+    def load_headings(self):
+        path = filedialog.askopenfilename(parent=self, title='Headings file',
+                                          filetypes=[('Text files', '*.txt *.tsv'), ('All files', '*')])
+        if not path:
+            return
+        self.status_label.config(text='Loading %s...' % os.path.basename(path))
+        self.load_button.config(state="disabled")
+        # Cuttering and sorting a large file takes a while, so it's done on a worker thread, like BulkWindow's runs.
+        self.messages = queue.Queue()
+        self.worker = threading.Thread(target=self.load_worker, args=(path, self.messages), daemon=True)
+        self.worker.start()
+        self.poll_job = self.after(self.POLL_INTERVAL, self.poll)
+
+    @staticmethod
+    def load_worker(path, messages):
+        """ Runs on the worker thread: puts ("done", ranges, path) or ("error", message) on messages. """
+        try:
+            # cutter_ranges is only needed once headings are loaded.
+            from cutter_ranges import CutterRanges
+            messages.put(("done", CutterRanges.load(path), path))
+        except Exception as error:
+            messages.put(("error", str(error) or type(error).__name__))
+
+    def poll(self):
+        self.poll_job = None
+        # Asked before the queue is read: a worker that had already stopped has put its message.
+        alive = self.worker.is_alive()
+        try:
+            message = self.messages.get_nowait()
+        except queue.Empty:
+            if alive:
+                self.poll_job = self.after(self.POLL_INTERVAL, self.poll)
+                return
+            message = ("error", "loading stopped without finishing")
+        if message[0] == "done":
+            self.ranges = message[1]
+            self.status_label.config(text='%d headings from %s' % (len(self.ranges), os.path.basename(message[2])))
+        else:
+            self.status_label.config(text='Could not load: %s' % message[1])
+        self.load_button.config(state="normal")
+        self.worker = None
+
+    def close(self):
+        # Stop polling before the widgets go away. A load still running finishes on its own and is dropped.
+        if self.poll_job is not None:
+            self.after_cancel(self.poll_job)
+            self.poll_job = None
+        self.destroy()
+
+    def show_entries(self, entries, marker=None, position=None):
+        self.results.delete(0, tk.END)
+        self.results.insert(tk.END, *["%s    %s" % entry for entry in entries])
+        if marker is not None:
+            self.results.insert(position, marker)
+            self.results.itemconfig(position, foreground="red")
+            self.results.see(position)
+
+    def show_range(self):
+        low = self.low_entry.get().strip()
+        if self.ranges is None or not low:
+            return
+        high = self.high_entry.get().strip() or None
+        try:
+            entries = self.ranges.range(low, high)
+        except ValueError as error:
+            self.status_label.config(text='Error: %s' % error)
+            return
+        self.show_entries(entries)
+        self.status_label.config(text='%d headings from %s to %s' % (len(entries), low, high or low))
+
+    def show_nearest(self):
+        cutter = self.low_entry.get().strip()
+        if self.ranges is None or not cutter:
+            return
+        try:
+            before, after = self.ranges.nearest(cutter, 10)
+        except ValueError as error:
+            self.status_label.config(text='Error: %s' % error)
+            return
+        self.show_entries(before + after, '-- %s files here --' % cutter, len(before))
+
+
+# Cutters a whole CSV, text or MARC21 file of headings, see bulk_cutter.py.
+# The file is processed on a worker thread, which sends its progress through a queue that this window polls with
+# after(), so the window keeps handling events while hundreds of thousands of headings are cuttered.
+class BulkWindow(tk.Toplevel):
+    # Milliseconds between two looks at the queue.
+    POLL_INTERVAL = 100
+
+    def __init__(self):
+        tk.Toplevel.__init__(self)
+        self.title('Bulk Cutters')
+        self.resizable(1, 0)
+        self.messages = queue.Queue()
+        self.cancel = threading.Event()
+        self.worker = None
+        self.poll_job = None
+        self.create_widgets()
+        self.grid_columnconfigure(0, weight=1)
+
+    def create_widgets(self):
+        self.file_label = tk.Label(self, text='Choose a CSV, text or MARC file of headings.', anchor='w')
+        self.file_label.grid(row=0, column=0, columnspan=2, sticky="nsew")
+
+        self.progress_bar = ttk.Progressbar(self, orient='horizontal', length=300, mode='determinate', maximum=1.0)
+        self.progress_bar.grid(row=1, column=0, columnspan=2, sticky="nsew")
+
+        self.status_label = tk.Label(self, text='', anchor='w')
+        self.status_label.grid(row=2, column=0, columnspan=2, sticky="nsew")
+
+        self.open_button = tk.Button(self, text='Open file...', command=self.start)
+        self.open_button.grid(row=3, column=0, sticky="nse")
+        self.cancel_button = tk.Button(self, text='Cancel', command=self.cancel.set, state="disabled")
+        self.cancel_button.grid(row=3, column=1, sticky="nsew")
+
+    def start(self):
+        path = filedialog.askopenfilename(parent=self, title='Headings file',
+                                          filetypes=[('Headings', '*.csv *.txt *.tsv *.mrc *.marc *.dat'),
+                                                     ('All files', '*')])
+        if not path:
+            return
+        output = filedialog.asksaveasfilename(parent=self, title='Save cutters as', defaultextension='.csv',
+                                              initialfile=os.path.splitext(os.path.basename(path))[0] + '-cutters.csv',
+                                              filetypes=[('CSV', '*.csv'), ('Tab separated', '*.tsv *.txt')])
+        if not output:
+            return
+        # bulk_cutter is only needed once a file has been chosen.
+        import bulk_cutter
+        self.messages = queue.Queue()
+        self.cancel.clear()
+        self.file_label.config(text='%s -> %s' % (os.path.basename(path), os.path.basename(output)))
+        self.status_label.config(text='Starting...')
+        self.progress_bar['value'] = 0
+        self.open_button.config(state="disabled")
+        self.cancel_button.config(state="normal")
+        self.worker = threading.Thread(target=bulk_cutter.run, args=(path, output, self.messages, self.cancel),
+                                       daemon=True)
+        self.worker.start()
+        self.poll_job = self.after(self.POLL_INTERVAL, self.poll)
+
+    def close(self):
+        # Stop the worker and the polling before the widgets go away.
+        self.cancel.set()
+        if self.poll_job is not None:
+            self.after_cancel(self.poll_job)
+            self.poll_job = None
+        self.destroy()
+
+    def poll(self):
+        self.poll_job = None
+        # Asked before the queue is read: a worker that had already stopped has put all of its messages.
+        alive = self.worker.is_alive()
+        # Only the newest progress message needs showing, so everything waiting in the queue is read at once.
+        finished = None
+        progress = None
+        while True:
+            try:
+                message = self.messages.get_nowait()
+            except queue.Empty:
+                break
+            if message[0] == "progress":
+                progress = message
+            else:
+                finished = message
+        if progress is not None:
+            kind, count, fraction, rate = progress
+            self.progress_bar['value'] = fraction
+            self.status_label.config(text='%d headings, %.0f headings/s' % (count, rate))
+        if finished is None and not alive:
+            finished = ("error", "the bulk run stopped without finishing")
+        if finished is None:
+            self.poll_job = self.after(self.POLL_INTERVAL, self.poll)
+            return
+        if finished[0] == "done":
+            self.progress_bar['value'] = 1.0
+            seconds = finished[2]
+            rate = finished[1] / seconds if seconds else 0.0
+            self.status_label.config(text='Done: %d headings in %.1f s, %.0f headings/s' % (finished[1], seconds,
+                                                                                            rate))
+        elif finished[0] == "cancelled":
+            self.status_label.config(text='Cancelled after %d headings.' % finished[1])
+        else:
+            self.status_label.config(text='Error: %s' % finished[1])
+        self.open_button.config(state="normal")
+        self.cancel_button.config(state="disabled")
+        self.worker = None
+
+
+# Center the window specified.
+def center(win):
+    """
+    centers a tkinter window
+    :param win: the root or Toplevel window to center
+    """
+    win.update_idletasks()
+    width = win.winfo_width()
+    frm_width = win.winfo_rootx() - win.winfo_x()
+    win_width = width + 2 * frm_width
+    height = win.winfo_height()
+    titlebar_height = win.winfo_rooty() - win.winfo_y()
+    win_height = height + titlebar_height + frm_width
+    x = win.winfo_screenwidth() // 2 - win_width // 2
+    y = win.winfo_screenheight() // 2 - win_height // 2
+    win.geometry('{}x{}+{}+{}'.format(width, height, x, y))
+    win.deiconify()
+
+
+def main():
+    global root
+    root = tk.Tk()
+    # Hide the root window, so it doesn't show up until we've centered it in the MainWindow.
+    root.attributes('-alpha', 0.0)
+    # Create an instance of our MainWindow Class.
+    app = MainWindow(root)
+    # Set the title of the root window / MainWindow.
+    root.title('LC Cutter Generator v.1.0.5')
+    # Set the icon of the root window.
+    root.iconbitmap(resource_path('my_icon_lettered_new.ico'))
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
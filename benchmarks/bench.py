@@ -0,0 +1,245 @@
+"""
+LCCutter is released under "The MIT License (MIT)"
+
+Copyright © 2023 Joseph Alway
+
+See LCCutter.py for the full license text.
+"""
+
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import LCCutter  # noqa: E402
+
+
+"""
+Benchmarks for cutter throughput, memory, start up time and GUI keystroke latency.
+
+    python benchmarks/bench.py -o before.json
+    python benchmarks/bench.py -o after.json --compare before.json
+
+Results are written as JSON together with the git commit, so runs from different commits can be compared. With
+--compare, any result that got worse by more than --tolerance is reported and the exit status is 1.
+The GUI benchmark needs a display; on a server run it under Xvfb, e.g. xvfb-run python benchmarks/bench.py --gui.
+"""
+
+_SYLLABLES = ["an", "ber", "son", "mac", "ley", "ton", "wood", "ham", "ford", "ing", "ric", "ell", "ov", "ski",
+              "stein", "berg", "o", "a", "ez", "ard"]
+_TITLE_WORDS = ["history", "of", "the", "modern", "world", "introduction", "to", "american", "literature", "and",
+                "science", "studies", "in", "medieval", "poetry", "essays", "on", "philosophy", "law", "society"]
+
+
+def corpora(count, seed=0):
+    """ Return the heading corpora used by the throughput benchmarks, count headings each. """
+    rng = random.Random(seed)
+
+    def surname():
+        return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(1, 3))).capitalize()
+
+    def title():
+        return " ".join(rng.choice(_TITLE_WORDS) for _ in range(rng.randint(4, 12))).capitalize()
+
+    def starting(prefixes):
+        return rng.choice(prefixes) + "".join(rng.choice("abcdefghijklmnopqrstuvwxyz")
+                                              for _ in range(rng.randint(1, 8)))
+
+    return {
+        "surnames": [surname() for _ in range(count)],
+        "titles": [title() for _ in range(count)],
+        "vowel_initial": [starting(list("aeiouy")) for _ in range(count)],
+        "s_initial": [starting(["s", "sc", "sh", "st"]) for _ in range(count)],
+        "qu_initial": [starting(["qu", "qa", "qi"]) for _ in range(count)],
+    }
+
+
+def _best_rate(function, words, repeat):
+    """ Return the best words/second of several runs, which is the least disturbed by other load on the machine. """
+    best = None
+    for _ in range(repeat):
+        began = time.perf_counter()
+        function(words)
+        seconds = time.perf_counter() - began
+        best = seconds if best is None else min(best, seconds)
+    return round(len(words) / best, 1)
+
+
+def bench_throughput(count, repeat):
+    results = {}
+    try:
+        import numpy  # noqa: F401
+        have_numpy = True
+    except ImportError:
+        have_numpy = False
+    for name, words in corpora(count).items():
+        results["scalar_%s_words_per_s" % name] = _best_rate(
+            lambda words: [LCCutter.get_cutter(word) for word in words], words, repeat)
+        results["class_%s_words_per_s" % name] = _best_rate(
+            lambda words: [LCCutter.LCCutter(word).get_cutter() for word in words], words, repeat)
+        results["stream_%s_words_per_s" % name] = _best_rate(
+            lambda words: sum(1 for _ in LCCutter.iter_cutters(words)), words, repeat)
+        if have_numpy:
+            results["vector_%s_words_per_s" % name] = _best_rate(LCCutter.get_cutters, words, repeat)
+    return results
+
+
+def bench_memory(count):
+    """ Peak memory per million records, for streaming batch mode and for a get_cutters result. """
+    words = corpora(count)["surnames"]
+    results = {}
+    tracemalloc.start()
+    for _ in LCCutter.iter_cutters(iter(words)):
+        pass
+    results["stream_peak_bytes_per_million"] = round(tracemalloc.get_traced_memory()[1] * 1e6 / count)
+    tracemalloc.stop()
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return results
+    LCCutter.get_cutters(words[:10])
+    tracemalloc.start()
+    cutters = LCCutter.get_cutters(words)
+    results["vector_peak_bytes_per_million"] = round(tracemalloc.get_traced_memory()[1] * 1e6 / count)
+    results["vector_result_bytes_per_million"] = round(cutters.nbytes * 1e6 / count)
+    tracemalloc.stop()
+    return results
+
+
+def bench_startup(repeat):
+    """ Time a fresh interpreter that imports LCCutter, minus a fresh interpreter that imports nothing. """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    def run(code):
+        times = []
+        for _ in range(repeat):
+            began = time.perf_counter()
+            subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+            times.append(time.perf_counter() - began)
+        return statistics.median(times)
+
+    check = "import sys, LCCutter; sys.exit('tkinter' in sys.modules)"
+    bare = run("pass")
+    with_import = run(check)
+    return {
+        "startup_interpreter_ms": round(bare * 1000, 3),
+        "startup_import_ms": round(max(with_import - bare, 0.0) * 1000, 3),
+    }
+
+
+def bench_gui(repeat):
+    """ Keystroke-to-render latency of the Tk window, typing one key at a time and pasting a long name at once. """
+    import tkinter as tk
+    import LCCutterGUI
+    root = tk.Tk()
+    LCCutterGUI.root = root
+    window = LCCutterGUI.MainWindow(root)
+    entry = window.cutter_entry
+    name = "International Federation of Library Associations and Institutions".replace(" ", "")
+    key_times = []
+    paste_times = []
+    for _ in range(repeat):
+        entry.delete(0, tk.END)
+        root.update()
+        for char in name:
+            began = time.perf_counter()
+            entry.insert(tk.END, char)
+            entry.event_generate("<KeyRelease>", keysym=char)
+            root.update()
+            key_times.append(time.perf_counter() - began)
+        entry.delete(0, tk.END)
+        root.update()
+        began = time.perf_counter()
+        for char in name:
+            entry.insert(tk.END, char)
+            entry.event_generate("<KeyRelease>", keysym=char)
+        root.update()
+        paste_times.append(time.perf_counter() - began)
+    root.destroy()
+    key_times.sort()
+    return {
+        "gui_keystroke_p50_ms": round(key_times[len(key_times) // 2] * 1000, 3),
+        "gui_keystroke_p99_ms": round(key_times[min(len(key_times) - 1, int(len(key_times) * 0.99))] * 1000, 3),
+        "gui_paste_%d_chars_ms" % len(name): round(statistics.median(paste_times) * 1000, 3),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, tolerance):
+    """
+    Return the results that got worse than the baseline by more than tolerance (a fraction).
+    Names ending in _per_s are better when higher, everything else is better when lower.
+    """
+    worse = []
+    for name, value in results.items():
+        old = baseline.get(name)
+        if not old or not value:
+            continue
+        change = value / old - 1.0
+        if name.endswith("_per_s"):
+            change = -change
+        if change > tolerance:
+            worse.append((name, old, value, change))
+    return worse
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks for LCCutter.")
+    parser.add_argument("-o", "--output", default=None, help="write the results as JSON to this file")
+    parser.add_argument("--compare", default=None, help="JSON results of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="fraction a result may get worse before it counts as a regression (default: 0.10)")
+    parser.add_argument("--count", type=int, default=200000, help="headings per corpus (default: 200000)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark, the best is kept (default: 3)")
+    parser.add_argument("--gui", action="store_true", help="also run the GUI latency benchmark (needs a display)")
+    args = parser.parse_args(argv)
+
+    results = {}
+    results.update(bench_throughput(args.count, args.repeat))
+    results.update(bench_memory(args.count))
+    results.update(bench_startup(max(args.repeat, 5)))
+    if args.gui:
+        results.update(bench_gui(args.repeat))
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "count": args.count,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out_file:
+            out_file.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as in_file:
+            baseline = json.load(in_file)["results"]
+        worse = compare(results, baseline, args.tolerance)
+        for name, old, new, change in worse:
+            sys.stderr.write("regression: %s %s -> %s (%.1f%% worse)\n" % (name, old, new, change * 100))
+        if worse:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+LCCutter is released under "The MIT License (MIT)"
+
+Copyright © 2023 Joseph Alway
+
+See LCCutter.py for the full license text.
+"""
+
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from urllib.parse import quote
+
+
+"""
+Load generator for the cutter service. Start the service first:
+
+    python LCCutter.py serve --port 8080
+    python benchmarks/loadgen.py --port 8080 --connections 32 --requests 50000
+
+Each connection is kept alive and sends one GET /cutter request at a time. Prints requests per second and latency
+percentiles, or JSON with --json.
+"""
+
+
+def random_words(count, seed=0):
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return ["".join(rng.choice(letters) for _ in range(rng.randint(3, 12))) for _ in range(count)]
+
+
+def load_words(path):
+    with open(path, encoding="utf-8") as in_file:
+        return [line.strip() for line in in_file if line.strip()]
+
+
+async def _connection(host, port, words, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for word in words:
+            request = "GET /cutter?word=%s HTTP/1.1\r\nHost: %s\r\n\r\n" % (quote(word), host)
+            began = time.perf_counter()
+            writer.write(request.encode("ascii"))
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - began)
+    finally:
+        writer.close()
+
+
+async def run(host, port, words, connections):
+    latencies = []
+    shares = [words[number::connections] for number in range(connections)]
+    began = time.perf_counter()
+    await asyncio.gather(*(_connection(host, port, share, latencies) for share in shares if share))
+    return time.perf_counter() - began, latencies
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load generator for the LCCutter HTTP service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--connections", type=int, default=32, help="concurrent keep-alive connections")
+    parser.add_argument("--requests", type=int, default=20000, help="total number of requests")
+    parser.add_argument("--words", default=None, help="file of words to send, one per line (default: random words)")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args(argv)
+
+    words = load_words(args.words) if args.words else random_words(args.requests)
+    words = (words * (args.requests // len(words) + 1))[:args.requests]
+    seconds, latencies = asyncio.run(run(args.host, args.port, words, args.connections))
+    latencies.sort()
+    results = {
+        "requests": len(latencies),
+        "connections": args.connections,
+        "seconds": round(seconds, 3),
+        "requests_per_second": round(len(latencies) / seconds, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3),
+    }
+    if args.json:
+        print(json.dumps(results))
+    else:
+        for name, value in results.items():
+            print("%s: %s" % (name, value))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""
+LCCutter is released under "The MIT License (MIT)"
+
+Copyright © 2023 Joseph Alway
+
+See LCCutter.py for the full license text.
+"""
+
+
+import csv
+import os
+import time
+
+from LCCutter import get_cutter
+
+
+"""
+Cutters for a whole file of headings, for the GUI's bulk mode. The work runs on a worker thread and reports through a
+queue, so the Tk thread only has to poll the queue with after() and never waits on the file.
+
+Headings come from the first column of a CSV or text file, or from MARC21 records: the $a of the 1XX main entry, or
+when there is none, the $a of the 245 title with its nonfiling characters (the second indicator) skipped.
+"""
+
+# Headings cuttered between two progress messages.
+PROGRESS_EVERY = 2000
+MARC_EXTENSIONS = (".mrc", ".marc", ".dat")
+_RECORD_END, _FIELD_END, _SUBFIELD = b"\x1d", b"\x1e", b"\x1f"
+_MAIN_ENTRIES = (b"100", b"110", b"111", b"130")
+# Punctuation that ends a MARC subfield before the next one, e.g. "Smith, John," or "The old man and the sea /".
+_MARC_PUNCTUATION = " /:;,."
+# MARC-8 (ANSEL) combining diacritics, 0xE0 to 0xFE. They come before the letter they go on, so they are dropped.
+_MARC8_COMBINING = bytes(range(0xE0, 0xFF))
+# The MARC-8 special letters and symbols, by their byte, which is the code point once the bytes are read as Latin-1.
+# The soft and hard signs, alif and ayn are not filed on, so they are dropped too.
+_MARC8_SPECIAL = str.maketrans({
+    "\xa1": "Ł", "\xa2": "Ø", "\xa3": "Đ", "\xa4": "Þ", "\xa5": "Æ", "\xa6": "Œ", "\xa7": None, "\xa8": "·",
+    "\xa9": "♭", "\xaa": "®", "\xab": "±", "\xac": "Ơ", "\xad": "Ư", "\xae": None, "\xb0": None, "\xb1": "ł",
+    "\xb2": "ø", "\xb3": "đ", "\xb4": "þ", "\xb5": "æ", "\xb6": "œ", "\xb7": None, "\xb8": "ı", "\xb9": "£",
+    "\xba": "ð", "\xbc": "ơ", "\xbd": "ư", "\xc0": "°", "\xc1": "ℓ", "\xc2": "℗", "\xc3": "©", "\xc4": "♯",
+    "\xc5": "¿", "\xc6": "¡", "\xc7": "ß", "\xc8": "€",
+})
+
+
+def read_csv(in_file):
+    """ Yield the first column of each row of a CSV or one heading per line text file. Empty rows are skipped. """
+    for row in csv.reader(in_file):
+        if row and row[0].strip():
+            yield row[0].strip()
+
+
+def _marc_fields(record):
+    """ Return {tag: field data} for the data fields of one MARC21 record, the first field of each tag. """
+    if len(record) < 24 or not record[12:17].isdigit():
+        raise ValueError("not a MARC21 record: %r" % record[:24])
+    base = int(record[12:17])
+    fields = {}
+    for entry in range(24, base - 1, 12):
+        tag = record[entry:entry + 3]
+        length = int(record[entry + 3:entry + 7])
+        start = base + int(record[entry + 7:entry + 12])
+        fields.setdefault(tag, record[start:start + length].rstrip(_FIELD_END))
+    return fields
+
+
+def _subfield_a(field):
+    for subfield in field[2:].split(_SUBFIELD):
+        if subfield[:1] == b"a":
+            return subfield[1:]
+    return None
+
+
+def marc_heading(record):
+    """ Return the heading of one MARC21 record as bytes, see the module docstring, or None. """
+    fields = _marc_fields(record)
+    for tag in _MAIN_ENTRIES:
+        if tag in fields:
+            heading = _subfield_a(fields[tag])
+            if heading:
+                return heading
+    title = fields.get(b"245")
+    if title is None:
+        return None
+    heading = _subfield_a(title)
+    if heading and title[1:2].isdigit():
+        heading = heading[int(title[1:2]):]
+    return heading
+
+
+def marc8_decode(data):
+    """ Return MARC-8 bytes as text, without their combining diacritics, e.g. b"\\xe2Emile" as "Emile". """
+    return data.translate(None, _MARC8_COMBINING).decode("latin-1").translate(_MARC8_SPECIAL)
+
+
+def read_marc(in_file, block_size=1024 * 1024):
+    """
+    Yield the heading of each record in a binary MARC21 file. Leader position 9 says whether a record is UTF-8 or
+    MARC-8, see marc8_decode.
+    """
+    carry = b""
+    while True:
+        block = in_file.read(block_size)
+        records = (carry + block).split(_RECORD_END)
+        # The last piece is an incomplete record, or empty when the block ended on a record. At the end of the file
+        # it's the last record, if that has no record terminator.
+        carry = records.pop() if block else b""
+        for record in records:
+            # Some exports put a line break between records.
+            record = record.lstrip(b"\r\n")
+            if not record:
+                continue
+            heading = marc_heading(record)
+            if heading:
+                if record[9:10] == b"a":
+                    heading = heading.decode("utf-8", "replace")
+                else:
+                    heading = marc8_decode(heading)
+                yield heading.strip(_MARC_PUNCTUATION)
+        if not block:
+            break
+
+
+def run(path, output, messages, cancel, encoding="utf-8", table=None):
+    """
+    Cutter every heading in path and write "heading,cutter" rows to output, tab separated unless it ends in ".csv".
+    Meant to run on a worker thread. Every PROGRESS_EVERY headings it puts ("progress", headings done, fraction of
+    the input read, headings per second) on messages, and at the end one of ("done", headings, seconds),
+    ("cancelled", headings) or ("error", message).
+    :param messages: a queue.Queue the GUI polls
+    :param cancel: a threading.Event; once it's set, the run stops at the next heading
+    """
+    began = time.perf_counter()
+    count = 0
+    try:
+        size = os.path.getsize(path) or 1
+        marc = path.lower().endswith(MARC_EXTENSIONS)
+        in_file = open(path, "rb") if marc else open(path, encoding="utf-8-sig" if encoding == "utf-8" else encoding,
+                                                     newline="")
+        # The position of the underlying binary file, which a text file's tell() can't give while it's iterated.
+        raw = in_file if marc else in_file.buffer
+        try:
+            headings = read_marc(in_file) if marc else read_csv(in_file)
+            dialect = "excel" if output.lower().endswith(".csv") else "excel-tab"
+            with open(output, "w", encoding="utf-8", newline="") as out_file:
+                writer = csv.writer(out_file, dialect)
+                for heading in headings:
+                    if cancel.is_set():
+                        messages.put(("cancelled", count))
+                        return count
+                    writer.writerow((heading, get_cutter(heading, None, table)))
+                    count += 1
+                    if not count % PROGRESS_EVERY:
+                        seconds = time.perf_counter() - began
+                        messages.put(("progress", count, min(raw.tell() / size, 1.0), count / seconds))
+        finally:
+            in_file.close()
+    except Exception as error:
+        # Whatever went wrong, the GUI has to hear that the run is over, or it would keep polling for it.
+        messages.put(("error", str(error) or type(error).__name__))
+        return count
+    messages.put(("done", count, time.perf_counter() - began))
+    return count
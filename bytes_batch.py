@@ -0,0 +1,162 @@
+"""
+LCCutter is released under "The MIT License (MIT)"
+
+Copyright © 2023 Joseph Alway
+
+See LCCutter.py for the full license text.
+"""
+
+
+import sys
+
+from LCCutter import SHORT_WORD, SUFFIX_DIGITS, get_cutter, get_engine
+
+
+"""
+A bytes-native batch mode for ASCII and Latin-1 heading files.
+
+The input is read with readinto into one reusable buffer, whole blocks are split into lines at once, and each cutter
+is built with integer table lookups and a single bytes.translate call that maps letters of either case to their
+expansion digit and deletes everything else in the same pass. There is no decoding, lower casing or str building per
+record. Lines with non-ASCII bytes are decoded and handed to get_cutter, so the output is always the same as the
+str-based batch mode. Records are separated by "\\n" (a "\\r\\n" line ending works too).
+"""
+
+# Bytes read from the input at a time.
+DEFAULT_BLOCK_SIZE = 1024 * 1024
+_SHORT_WORD = SHORT_WORD.encode("ascii")
+_STRIP = b" \t\r\n"
+_LETTERS = bytes(range(ord("a"), ord("z") + 1)) + bytes(range(ord("A"), ord("Z") + 1))
+
+
+def _compile(engine):
+    """ Turn the engine's str tables into tables indexed by byte values, once per engine. """
+    tables = getattr(engine, "_byte_tables", None)
+    if tables is not None:
+        return tables
+    lower = bytes(range(256)).lower()
+    # heads[first << 8 | second] is the cutter head for a word starting with those two (lower case) bytes.
+    # fallback[first] is the head for a word whose first two letters are not in the tables.
+    fallback = [("." + chr(first).upper()).encode("ascii") for first in range(128)]
+    heads = [None] * 65536
+    for first in range(128):
+        for second in range(128):
+            heads[first << 8 | second] = fallback[first]
+    for prefix, head in engine.heads.items():
+        heads[ord(prefix[0]) << 8 | ord(prefix[1])] = head.encode("ascii")
+    # Prefixes whose digit depends on the third letter, e.g. "sc".
+    for prefix in engine.short:
+        heads[ord(prefix[0]) << 8 | ord(prefix[1])] = None
+    short = {ord(prefix[0]) << 8 | ord(prefix[1]): head.encode("ascii") for prefix, head in engine.short.items()}
+    third = {ord(prefix[0]) << 16 | ord(prefix[1]) << 8 | ord(prefix[2]): head.encode("ascii")
+             for prefix, head in engine.third.items()}
+    skip_third = {ord(prefix[0]) << 8 | ord(prefix[1]) for prefix in engine.skip_third}
+    # One translate table for both cases, with every byte that isn't a letter deleted.
+    expansion = bytearray(range(256))
+    for code, digits in engine.expansion.items():
+        expansion[code] = ord(digits)
+        expansion[ord(chr(code).upper())] = ord(digits)
+    delete = bytes(code for code in range(256) if code not in _LETTERS)
+    tables = (lower, fallback, heads, short, third, skip_third, bytes(expansion), delete)
+    engine._byte_tables = tables
+    return tables
+
+
+def iter_blocks(in_file, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Yield blocks of whole lines from a binary file. Every block but the last ends with "\\n".
+    The file is read into the same buffer every time, only the complete lines are copied out.
+    """
+    buffer = bytearray(block_size)
+    view = memoryview(buffer)
+    carry = b""
+    while True:
+        size = in_file.readinto(buffer)
+        if not size:
+            break
+        end = buffer.rfind(b"\n", 0, size) + 1
+        if end:
+            yield carry + view[:end]
+            carry = bytes(view[end:size])
+        else:
+            carry += view[:size]
+    if carry:
+        yield carry + b"\n"
+
+
+def cutter_block(block, with_word=False, encoding="latin-1", table=None):
+    """
+    Return the output lines for one block of input lines, in a bytearray.
+    :param block: bytes ending with "\\n"
+    :param encoding: used to decode the lines with non-ASCII bytes
+    :param table: the cutter table to use, see LCCutter.get_engine
+    """
+    lower, fallback, heads, short, third, skip_third, expansion, delete = _compile(get_engine(table))
+    suffix = SUFFIX_DIGITS[0].encode("ascii")
+    out = bytearray()
+    lines = block.split(b"\n")
+    # The block ends with "\n", so the last piece is always empty.
+    lines.pop()
+    for line in lines:
+        line = line.strip(_STRIP)
+        if with_word:
+            out += line
+            out += b"\t"
+        if not line.isascii():
+            out += get_cutter(line.decode(encoding), None, table).encode(encoding)
+            out += b"\n"
+            continue
+        if len(line) < 2:
+            out += _SHORT_WORD
+            out += b"\n"
+            continue
+        first = lower[line[0]]
+        prefix = first << 8 | lower[line[1]]
+        head = heads[prefix]
+        if head is not None:
+            cutter = head + line[2:].translate(expansion, delete)
+        elif len(line) < 3:
+            cutter = short[prefix]
+        else:
+            head = third.get(prefix << 8 | lower[line[2]]) or fallback[first]
+            if prefix in skip_third:
+                cutter = head + line[3:].translate(expansion, delete)
+            else:
+                cutter = head + line[2:].translate(expansion, delete)
+        out += cutter
+        # Cutters shouldn't end in 1 or 0.
+        if cutter[-1] in b"01":
+            out += suffix
+        out += b"\n"
+    return out
+
+
+def bytes_batch(files=None, output=None, with_word=False, encoding="latin-1", block_size=DEFAULT_BLOCK_SIZE,
+                table=None):
+    """
+    Cutter every line of the input files, bytes in and bytes out, and write the cutters in the same order.
+    :param files: paths to read in order, or None / "-" for stdin
+    :param encoding: the encoding of the input; only used for lines with non-ASCII bytes
+    :param table: the cutter table to use, see LCCutter.get_engine
+    :return: the number of bytes written
+    """
+    if not files:
+        files = ["-"]
+    written = 0
+    out_file = sys.stdout.buffer if output is None or output == "-" else open(output, "wb")
+    try:
+        for path in files:
+            in_file = sys.stdin.buffer if path == "-" else open(path, "rb", buffering=0)
+            try:
+                for block in iter_blocks(in_file, block_size):
+                    written += out_file.write(cutter_block(block, with_word, encoding, table))
+            finally:
+                if in_file is not sys.stdin.buffer:
+                    in_file.close()
+    finally:
+        if out_file is not sys.stdout.buffer:
+            out_file.close()
+        else:
+            out_file.flush()
+    return written
+
@@ -0,0 +1,147 @@
+"""
+LCCutter is released under "The MIT License (MIT)"
+
+Copyright © 2023 Joseph Alway
+
+See LCCutter.py for the full license text.
+"""
+
+
+import sqlite3
+
+from LCCutter import SHORT_WORD, get_engine, lookup_cutter, normalize_word, resolve_cutter
+
+
+"""
+A persistent cutter cache for re-cuttering catalog dumps where few headings change between runs.
+
+What is cached is the table cutter of each heading, before resolve_cutter: every heading, cached or not, is then
+resolved against this run's shelflist, so a cached cutter can't be given out twice. Cutters are kept per cutter table
+version, so a new table version never reuses old results.
+
+A hit has to cost less than working the cutter out again, which takes about a microsecond, so nothing is looked up
+or written per heading. The cache file is SQLite, holding one segment per run: the headings that run added and their
+cutters, as two newline separated texts. Opening the cache reads the segments of the table version into a dict, with
+two splits each, a hit is one dict lookup, and closing it writes the new headings as one more segment. Past the size
+limit the oldest segments are dropped first, so eviction is by the run an entry was added in; an entry that is still
+used just comes back in a new segment. Every _COMPACT_AFTER runs the segments of a version are joined into one.
+"""
+
+# Default largest number of cached cutters. Each one takes about 150 bytes of memory while the cache is open.
+DEFAULT_CACHE_SIZE = 10000000
+# Segments a table version can have before they are joined.
+_COMPACT_AFTER = 32
+
+
+class CutterCache:
+    def __init__(self, path, max_entries=DEFAULT_CACHE_SIZE, table=None):
+        """ :param table: the cutter table to use, see LCCutter.get_engine; only entries for its version are used """
+        self.path = path
+        self.max_entries = max_entries
+        self.table = table
+        self.engine = get_engine(table)
+        self.version = self.engine.version
+        self.db = sqlite3.connect(path)
+        # Caches written before segments kept one row per heading, under a hash of it.
+        self.db.execute("DROP TABLE IF EXISTS cutters")
+        self.db.execute("DROP TABLE IF EXISTS runs")
+        self.db.execute("CREATE TABLE IF NOT EXISTS segments (number INTEGER PRIMARY KEY, version TEXT NOT NULL, "
+                        "count INTEGER NOT NULL, words TEXT NOT NULL, cutters TEXT NOT NULL)")
+        self.db.commit()
+        # heading text -> table cutter, in the order the entries were added.
+        self.entries = {}
+        self.segments = 0
+        for words, cutters in self.db.execute("SELECT words, cutters FROM segments WHERE version = ? ORDER BY number",
+                                              (self.version,)):
+            self.entries.update(zip(words.split("\n"), cutters.split("\n")))
+            self.segments += 1
+        # Entries added by this run.
+        self.new = {}
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+    def close(self):
+        self.save()
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _write_segment(self, items):
+        words = list(items)
+        self.db.execute("INSERT INTO segments (version, count, words, cutters) VALUES (?, ?, ?, ?)",
+                        (self.version, len(words), "\n".join(words), "\n".join([items[word] for word in words])))
+
+    def save(self):
+        """ Write the entries this run added as a new segment, then drop the oldest entries past max_entries. """
+        if self.segments >= _COMPACT_AFTER:
+            self.db.execute("DELETE FROM segments WHERE version = ?", (self.version,))
+            self._write_segment(self.entries)
+        elif self.new:
+            self._write_segment(self.new)
+        extra = self.db.execute("SELECT COALESCE(SUM(count), 0) FROM segments").fetchone()[0] - self.max_entries
+        while extra > 0:
+            number, count, words, cutters = self.db.execute("SELECT number, count, words, cutters FROM segments "
+                                                            "ORDER BY number LIMIT 1").fetchone()
+            if count <= extra:
+                self.db.execute("DELETE FROM segments WHERE number = ?", (number,))
+            else:
+                # Keep the newer part of the segment.
+                self.db.execute("UPDATE segments SET count = ?, words = ?, cutters = ? WHERE number = ?",
+                                (count - extra, "\n".join(words.split("\n")[extra:]),
+                                 "\n".join(cutters.split("\n")[extra:]), number))
+            extra -= count
+        self.db.commit()
+        self.new = {}
+
+    def iter_cutters(self, words, with_word=False, shelflist=None, only_new=False, filing=None):
+        """
+        Yield output lines like LCCutter.iter_cutters, taking cutters from the cache where it can.
+        :param only_new: only yield lines for headings that were not in the cache
+        :param shelflist: see LCCutter.resolve_cutter; cached cutters are resolved against it like new ones
+        :param filing: see LCCutter.iter_cutters; the cache is keyed by the filing text
+        """
+        entries = self.entries
+        new = self.new
+        engine = self.engine
+        get = entries.get
+        misses = 0
+        count = 0
+        try:
+            for word in words:
+                count += 1
+                text = word if filing is None else filing(word)
+                cutter = get(text)
+                if cutter is None:
+                    misses += 1
+                    cutter = lookup_cutter(normalize_word(text), engine)
+                    # A newline would split the entry when the cache is read back.
+                    if "\n" not in text:
+                        entries[text] = new[text] = cutter
+                elif only_new:
+                    # Output that didn't have to be written. The cutter still takes its place on the shelflist.
+                    if cutter != SHORT_WORD:
+                        cutter = resolve_cutter(cutter, shelflist)
+                    line = word + "\t" + cutter + "\n" if with_word else cutter + "\n"
+                    self.bytes_saved += len(line) if line.isascii() else len(line.encode("utf-8"))
+                    continue
+                if cutter != SHORT_WORD:
+                    cutter = resolve_cutter(cutter, shelflist)
+                yield word + "\t" + cutter + "\n" if with_word else cutter + "\n"
+        finally:
+            self.misses += misses
+            self.hits += count - misses
+
+    def report(self):
+        """ Return a one line summary of this run. """
+        total = self.hits + self.misses
+        rate = 100.0 * self.hits / total if total else 0.0
+        return "cache: %d hits, %d misses, %.1f%% hit rate, %d bytes not written" % (self.hits, self.misses, rate,
+                                                                                     self.bytes_saved)
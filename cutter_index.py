@@ -0,0 +1,240 @@
+"""
+LCCutter is released under "The MIT License (MIT)"
+
+Copyright © 2023 Joseph Alway
+
+See LCCutter.py for the full license text.
+"""
+
+
+import bisect
+import heapq
+import mmap
+import os
+import shutil
+import struct
+
+from LCCutter import next_free_cutter
+from shelflist import extract_shelf_key
+
+
+"""
+An on-disk index of the cutters already on the shelves, for catalogs too large to load into a Shelflist on every run.
+Like a Shelflist it is keyed by class number and cutter, e.g. "QA76.73.P98" (see shelflist.extract_shelf_key), and a
+new cutter is checked through a shelflist.ClassShelflist.
+
+The index file is opened with mmap, so opening it costs nothing and lookups only touch the pages they need.
+File layout, all integers little-endian:
+    header:  magic b"LCCIDX01", key width (uint16), 6 bytes padding, record count (uint64), offset of the ids (uint64)
+    records: record count times (shelf key padded with zero bytes to the key width, offset of its record id (uint64)),
+             sorted by cutter and then record id
+    ids:     the record ids, each followed by a newline
+New cutters go to a small text delta segment next to the index (<path>.delta, one "cutter<TAB>record id" per line),
+which merge() folds back into the main file.
+"""
+
+MAGIC = b"LCCIDX01"
+_HEADER = struct.Struct("<8sH6xQQ")
+_OFFSET = struct.Struct("<Q")
+# Delta entries are merged into the main file once there are this many of them.
+DEFAULT_MERGE_THRESHOLD = 100000
+
+
+class CutterIndex:
+    """
+    A memory-mapped, sorted index of cutters and the record ids that use them.
+    Has the same __contains__ / add interface as shelflist.Shelflist, so it can be passed to LCCutter.get_cutter.
+    """
+    def __init__(self, path, writable=False, merge_threshold=DEFAULT_MERGE_THRESHOLD):
+        """
+        :param writable: write cutters given to add() to the delta segment. Otherwise they are only remembered until
+                         the index is closed.
+        """
+        self.path = path
+        self.delta_path = path + ".delta"
+        self.writable = writable
+        self.merge_threshold = merge_threshold
+        self._file = None
+        self._map = None
+        self._delta_file = None
+        self._open()
+
+    def _open(self):
+        self._file = open(self.path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.width, self.count, self._ids_offset = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError("%s is not a cutter index" % self.path)
+        self._record_size = self.width + _OFFSET.size
+        # The delta segment is small, so it is kept in memory: a list of (cutter, record id) that add() appends to and
+        # that is only sorted when it's read in order, and a set of its cutters for __contains__.
+        self.delta = []
+        if os.path.exists(self.delta_path):
+            with open(self.delta_path, encoding="utf-8") as delta_file:
+                for line in delta_file:
+                    cutter, _, record_id = line.rstrip("\n").partition("\t")
+                    self.delta.append((cutter, record_id))
+        self.delta_cutters = {cutter for cutter, _ in self.delta}
+        self._delta_sorted = False
+        if self.writable:
+            self._delta_file = open(self.delta_path, "a", encoding="utf-8")
+
+    def close(self):
+        if self._delta_file is not None:
+            self._delta_file.close()
+            self._delta_file = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.count + len(self.delta)
+
+    @classmethod
+    def build(cls, path, records, **kwargs):
+        """
+        Write a new index file from (cutter, record id) pairs, replacing any index and delta segment at path,
+        and return it opened.
+        """
+        records = sorted(records)
+        write_index(path, records, len(records), max([_width(cutter) for cutter, _ in records] or [1]))
+        if os.path.exists(path + ".delta"):
+            os.remove(path + ".delta")
+        return cls(path, **kwargs)
+
+    def _records(self):
+        for position in range(self.count):
+            yield self._key(position).rstrip(b"\0").decode("utf-8"), self._record_id(position)
+
+    def _key(self, position):
+        start = _HEADER.size + position * self._record_size
+        return self._map[start:start + self.width]
+
+    def _record_id(self, position):
+        offset = _OFFSET.unpack_from(self._map, _HEADER.size + position * self._record_size + self.width)[0]
+        end = self._map.find(b"\n", self._ids_offset + offset)
+        return self._map[self._ids_offset + offset:end].decode("utf-8")
+
+    def _bisect(self, key):
+        """ Return the position of the first record whose key is not less than key. """
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def __contains__(self, cutter):
+        key = cutter.encode("utf-8")
+        if len(key) <= self.width:
+            position = self._bisect(key)
+            if position < self.count and self._key(position).rstrip(b"\0") == key:
+                return True
+        return cutter in self.delta_cutters
+
+    def find(self, cutter):
+        """ Return the record ids filed under exactly this cutter. """
+        return [record_id for found, record_id in self.starting_with(cutter) if found == cutter]
+
+    def _sorted_delta(self):
+        # Sorting a sorted list with some entries appended is close to linear, the new entries are one more run.
+        if not self._delta_sorted:
+            self.delta.sort()
+            self._delta_sorted = True
+        return self.delta
+
+    def starting_with(self, prefix):
+        """ Yield (cutter, record id) for every cutter starting with prefix, in sorted order. """
+        key = prefix.encode("utf-8")
+        start = self._bisect(key)
+        end = self._bisect(key + b"\xff")
+        main = ((self._key(position).rstrip(b"\0").decode("utf-8"), self._record_id(position))
+                for position in range(start, end))
+        delta = self._sorted_delta()
+        delta_start = bisect.bisect_left(delta, (prefix,))
+        delta_end = bisect.bisect_left(delta, (prefix + "\uffff",))
+        return heapq.merge(main, delta[delta_start:delta_end])
+
+    def has_class_numbers(self):
+        """ Return whether any key has a class number, see shelflist.Shelflist.has_class_numbers. """
+        if self.count and not self._key(self.count - 1).startswith(b"."):
+            return True
+        return any(not cutter.startswith(".") for cutter in self.delta_cutters)
+
+    def next_free(self, cutter):
+        """ Return the first free cutter for cutter, see LCCutter.next_free_cutter. """
+        return next_free_cutter(cutter, self)
+
+    def add(self, cutter, record_id=""):
+        """ Record a newly assigned cutter in the delta segment. Merges the delta once it grows past the threshold. """
+        self.delta.append((cutter, record_id))
+        self.delta_cutters.add(cutter)
+        self._delta_sorted = False
+        if self._delta_file is not None:
+            self._delta_file.write("%s\t%s\n" % (cutter, record_id))
+            if len(self.delta) >= self.merge_threshold:
+                self.merge()
+
+    def merge(self):
+        """ Rewrite the main index file with the delta segment folded in, and empty the delta. """
+        temp_path = self.path + ".tmp"
+        width = max([self.width] + [_width(cutter) for cutter, _ in self.delta])
+        write_index(temp_path, heapq.merge(self._records(), self._sorted_delta()), len(self), width)
+        self.close()
+        os.replace(temp_path, self.path)
+        if os.path.exists(self.delta_path):
+            os.remove(self.delta_path)
+        self._open()
+
+
+def _width(cutter):
+    return len(cutter.encode("utf-8"))
+
+
+def write_index(path, records, count, width):
+    """
+    Write sorted (cutter, record id) pairs to an index file. The records are read once, so they can come from a
+    generator; the record ids are spooled to a temporary file meanwhile.
+    :param count: the number of records
+    :param width: the key width, at least the longest cutter in bytes
+    """
+    record = struct.Struct("<%dsQ" % width)
+    offset = 0
+    ids_path = path + ".ids"
+    with open(path, "wb") as out_file, open(ids_path, "w+b") as ids_file:
+        out_file.write(_HEADER.pack(MAGIC, width, count, _HEADER.size + count * record.size))
+        for cutter, record_id in records:
+            out_file.write(record.pack(cutter.encode("utf-8"), offset))
+            encoded = record_id.encode("utf-8") + b"\n"
+            ids_file.write(encoded)
+            offset += len(encoded)
+        ids_file.seek(0)
+        shutil.copyfileobj(ids_file, out_file)
+    os.remove(ids_path)
+
+
+def read_export(path, encoding="utf-8"):
+    """
+    Yield (shelf key, record id) from a call number export, see shelflist.extract_shelf_key. Each line is "record id<TAB>call number", or only a call
+    number, in which case the line number is used as the record id. Lines without a cutter are skipped.
+    """
+    with open(path, encoding=encoding) as in_file:
+        for number, line in enumerate(in_file, 1):
+            record_id, tab, call_number = line.rstrip("\r\n").partition("\t")
+            if not tab:
+                record_id, call_number = str(number), record_id
+            key = extract_shelf_key(call_number)
+            if key:
+                yield key, record_id
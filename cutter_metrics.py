@@ -0,0 +1,209 @@
+"""
+LCCutter is released under "The MIT License (MIT)"
+
+Copyright © 2023 Joseph Alway
+
+See LCCutter.py for the full license text.
+"""
+
+
+import json
+import time
+
+from LCCutter import SHORT_WORD, get_engine, lookup_cutter, normalize_word, read_words, resolve_cutter, write_lines
+
+
+"""
+Per-stage metrics for batch runs: where the time goes between reading the input, normalizing each heading, the cutter
+table lookup, resolving collisions and writing the output.
+
+Instrumentation is a separate, timed copy of the batch pipeline that is only chosen when metrics are asked for, so the
+normal pipeline in LCCutter.py carries no checks, counters or clock calls at all. Latencies go into log2 histograms
+(one integer bit_length and one list increment per observation). Every Nth record can be run under cProfile, or any
+profiler with enable() and disable(). At the end of a run the metrics are written as Prometheus text or JSON.
+"""
+
+STAGES = ("read", "normalize", "get_cutter", "resolve", "write")
+FORMATS = ("prometheus", "json")
+
+
+class Histogram:
+    """ Latencies in nanoseconds, counted in power of two buckets: bucket i holds the values below 2 ** i. """
+    __slots__ = ("buckets", "count", "total")
+
+    def __init__(self):
+        self.buckets = [0] * 65
+        self.count = 0
+        self.total = 0
+
+    def observe(self, nanoseconds):
+        self.buckets[nanoseconds.bit_length()] += 1
+        self.count += 1
+        self.total += nanoseconds
+
+    def quantile(self, fraction):
+        """ Return the upper bound in nanoseconds of the bucket holding the given quantile, e.g. 0.99. """
+        rank = fraction * self.count
+        seen = 0
+        for bit_length, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return 2 ** bit_length
+        return 0
+
+
+class Metrics:
+    """
+    Counters and stage histograms for one run.
+    :param profile_sample: run every Nth record under the profiler, 0 for never
+    :param profiler: an object with enable() and disable(), e.g. a sampling profiler's adapter (default: cProfile)
+    """
+    def __init__(self, profile_sample=0, profiler=None):
+        self.stages = {stage: Histogram() for stage in STAGES}
+        self.counters = {"records": 0, "short_words": 0, "folded": 0, "resolved": 0}
+        self.profile_sample = profile_sample
+        if profile_sample and profiler is None:
+            import cProfile
+            profiler = cProfile.Profile()
+        self.profiler = profiler
+        self.started = None
+        self.seconds = 0.0
+
+    def start(self):
+        self.started = time.perf_counter()
+
+    def stop(self):
+        self.seconds = time.perf_counter() - self.started
+
+    def records_per_second(self):
+        return self.counters["records"] / self.seconds if self.seconds else 0.0
+
+    def as_dict(self):
+        stages = {}
+        for stage, histogram in self.stages.items():
+            stages[stage] = {
+                "count": histogram.count,
+                "seconds": histogram.total / 1e9,
+                "p50_ns": histogram.quantile(0.5),
+                "p99_ns": histogram.quantile(0.99),
+                # [upper bound in nanoseconds, count] for the buckets that are not empty.
+                "buckets": [[2 ** bit_length, count] for bit_length, count in enumerate(histogram.buckets) if count],
+            }
+        return {"seconds": self.seconds, "records_per_second": self.records_per_second(),
+                "counters": dict(self.counters), "stages": stages}
+
+    def as_json(self):
+        return json.dumps(self.as_dict(), indent=2) + "\n"
+
+    def as_prometheus(self):
+        """ Return the metrics in the Prometheus text format, e.g. for the node exporter's textfile collector. """
+        lines = []
+        for name, value in self.counters.items():
+            lines.append("# TYPE lccutter_%s_total counter" % name)
+            lines.append("lccutter_%s_total %d" % (name, value))
+        lines.append("# TYPE lccutter_records_per_second gauge")
+        lines.append("lccutter_records_per_second %.1f" % self.records_per_second())
+        lines.append("# TYPE lccutter_run_seconds gauge")
+        lines.append("lccutter_run_seconds %.6f" % self.seconds)
+        lines.append("# TYPE lccutter_stage_seconds histogram")
+        for stage, histogram in self.stages.items():
+            last = max((bit_length for bit_length, count in enumerate(histogram.buckets) if count), default=0)
+            seen = 0
+            for bit_length in range(last + 1):
+                seen += histogram.buckets[bit_length]
+                lines.append('lccutter_stage_seconds_bucket{stage="%s",le="%.9g"} %d'
+                             % (stage, 2 ** bit_length / 1e9, seen))
+            lines.append('lccutter_stage_seconds_bucket{stage="%s",le="+Inf"} %d' % (stage, histogram.count))
+            lines.append('lccutter_stage_seconds_sum{stage="%s"} %.9f' % (stage, histogram.total / 1e9))
+            lines.append('lccutter_stage_seconds_count{stage="%s"} %d' % (stage, histogram.count))
+        return "\n".join(lines) + "\n"
+
+    def write(self, path, metrics_format="prometheus"):
+        text = self.as_json() if metrics_format == "json" else self.as_prometheus()
+        with open(path, "w", encoding="utf-8") as out_file:
+            out_file.write(text)
+
+
+def _timed_words(words, histogram):
+    """ Yield the words, timing how long each one took to read. """
+    words = iter(words)
+    clock = time.perf_counter_ns
+    observe = histogram.observe
+    while True:
+        start = clock()
+        try:
+            word = next(words)
+        except StopIteration:
+            return
+        observe(clock() - start)
+        yield word
+
+
+def _timed_lines(lines, histogram):
+    """ Yield the lines, timing how long the consumer takes with each one, which is the write. """
+    clock = time.perf_counter_ns
+    observe = histogram.observe
+    for line in lines:
+        start = clock()
+        yield line
+        observe(clock() - start)
+
+
+def iter_cutters(words, metrics, with_word=False, shelflist=None, filing=None, table=None):
+    """
+    Yield the same lines as LCCutter.iter_cutters, timing the normalize, get_cutter and resolve stages of each record.
+    These call the steps of LCCutter.get_cutter one at a time. With titles, normalize includes the filing function.
+    """
+    engine = get_engine(table)
+    clock = time.perf_counter_ns
+    normalize = metrics.stages["normalize"].observe
+    lookup = metrics.stages["get_cutter"].observe
+    resolve = metrics.stages["resolve"].observe
+    counters = metrics.counters
+    profiler = metrics.profiler
+    sample = metrics.profile_sample
+    countdown = sample
+    for word in words:
+        if sample:
+            countdown -= 1
+            if not countdown:
+                countdown = sample
+                profiler.enable()
+        start = clock()
+        text = word if filing is None else filing(word)
+        if not text.isascii():
+            counters["folded"] += 1
+        text = normalize_word(text)
+        normalized = clock()
+        normalize(normalized - start)
+        cutter = lookup_cutter(text, engine)
+        if cutter is SHORT_WORD:
+            counters["short_words"] += 1
+        else:
+            looked_up = clock()
+            lookup(looked_up - normalized)
+            resolved = resolve_cutter(cutter, shelflist)
+            resolve(clock() - looked_up)
+            if resolved != cutter:
+                counters["resolved"] += 1
+            cutter = resolved
+        counters["records"] += 1
+        if sample and countdown == sample:
+            profiler.disable()
+        yield word + "\t" + cutter + "\n" if with_word else cutter + "\n"
+
+
+def batch(files=None, output=None, with_word=False, encoding="utf-8", shelflist=None, filing=None, table=None,
+          metrics=None):
+    """
+    LCCutter.batch with every stage timed.
+    :return: the Metrics of the run
+    """
+    if metrics is None:
+        metrics = Metrics()
+    metrics.start()
+    words = _timed_words(read_words(files, encoding), metrics.stages["read"])
+    lines = iter_cutters(words, metrics, with_word, shelflist, filing, table)
+    write_lines(_timed_lines(lines, metrics.stages["write"]), output, encoding)
+    metrics.stop()
+    return metrics
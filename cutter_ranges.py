@@ -0,0 +1,89 @@
+"""
+LCCutter is released under "The MIT License (MIT)"
+
+Copyright © 2023 Joseph Alway
+
+See LCCutter.py for the full license text.
+"""
+
+
+import bisect
+
+from LCCutter import get_cutter
+from shelf_sort import cutter_key
+from shelflist import BARE_CUTTER_RE
+
+
+"""
+Reverse lookup from cutters to headings, for shelf-reading and for finding room to interfile new items.
+
+The headings are cuttered once with get_cutter, and the (cutter, heading) pairs are kept sorted by the shelf order key
+of the cutter (see shelf_sort.cutter_key), so every cutter range is one contiguous slice of the index. A range or
+nearest-neighbour query is then two binary searches, however many headings are loaded.
+"""
+
+
+def _heading_cutter(heading, table):
+    """ Return the cutter of a heading, or None when it has none that files, e.g. a one letter heading. """
+    cutter = get_cutter(heading, None, table)
+    return cutter if cutter[:1] == "." and BARE_CUTTER_RE.match(cutter, 1) else None
+
+
+class CutterRanges:
+    def __init__(self, entries=()):
+        """ :param entries: (cutter, heading) pairs, in any order. Raises ValueError for a cutter that isn't one. """
+        entries = sorted(((cutter_key(cutter), cutter, heading) for cutter, heading in entries),
+                         key=lambda entry: entry[0])
+        self.keys = [key for key, cutter, heading in entries]
+        self.entries = [(cutter, heading) for key, cutter, heading in entries]
+
+    @classmethod
+    def from_headings(cls, headings, table=None):
+        """ Build the index from headings, cuttering each one. Headings without a cutter are left out. """
+        pairs = ((_heading_cutter(heading, table), heading) for heading in headings)
+        return cls((cutter, heading) for cutter, heading in pairs if cutter is not None)
+
+    @classmethod
+    def load(cls, path, encoding="utf-8", table=None):
+        """
+        Build the index from a file of headings, one per line. A line of "heading<TAB>cutter", as written by
+        "LCCutter.py batch --with-word", keeps its cutter, so cutters adjusted for collisions are indexed as assigned.
+        """
+        entries = []
+        with open(path, encoding=encoding) as in_file:
+            for line in in_file:
+                heading, _, cutter = line.rstrip("\r\n").partition("\t")
+                heading = heading.strip()
+                cutter = cutter.strip().lstrip(".").upper()
+                if cutter and BARE_CUTTER_RE.match(cutter):
+                    entries.append(("." + cutter, heading))
+                else:
+                    cutter = _heading_cutter(heading, table)
+                    if cutter is not None:
+                        entries.append((cutter, heading))
+        return cls(entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def range(self, low, high=None):
+        """
+        Return the (cutter, heading) pairs from cutter low through cutter high in shelf order. high takes in every
+        cutter that extends it, so range(".S62", ".S7") includes ".S72" and ".S7U4". Without high, it's the cutters
+        that extend low. Raises ValueError if low or high isn't a cutter, see shelf_sort.cutter_key.
+        """
+        if high is None:
+            high = low
+        start = bisect.bisect_left(self.keys, cutter_key(low))
+        # The key of high without its end byte, then above any digit: after every cutter that starts with high.
+        end = bisect.bisect_right(self.keys, cutter_key(high)[:-1] + b"\xff")
+        return self.entries[start:end]
+
+    def nearest(self, cutter, count=5):
+        """
+        Return the headings around where cutter files: up to count (cutter, heading) pairs before it and up to count
+        from it on, as (before, after). The gap between before[-1] and after[0] is where a new item would go.
+        Raises ValueError if cutter isn't a cutter.
+        """
+        position = bisect.bisect_left(self.keys, cutter_key(cutter))
+        return self.entries[max(position - count, 0):position], self.entries[position:position + count]
@@ -0,0 +1,236 @@
+"""
+LCCutter is released under "The MIT License (MIT)"
+
+Copyright © 2023 Joseph Alway
+
+See LCCutter.py for the full license text.
+"""
+
+
+import asyncio
+import collections
+import json
+from urllib.parse import parse_qs, urlsplit
+
+from LCCutter import get_cutter, get_cutters
+
+
+"""
+A small local HTTP/JSON service for the LCCutter algorithm, so other systems can ask for cutters without starting a
+process per record.
+
+    GET  /cutter?word=smith              -> {"word": "smith", "cutter": ".S6584"}
+    POST /cutters  {"words": ["smith"]}  -> {"cutters": [".S6584"]}
+    GET  /health                         -> {"status": "ok"}
+
+Connections are kept alive. Single-word requests that arrive together are answered as one micro-batch, and an LRU
+cache sits in front of both endpoints. POST batches are decoded and cuttered on worker threads, a chunk at a time, so
+a large one doesn't hold up the other connections.
+"""
+
+# Batches at least this large go through the NumPy path when NumPy is installed.
+_VECTOR_MIN = 64
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large"}
+# Largest request body accepted, in bytes.
+MAX_BODY = 16 * 1024 * 1024
+# Words of a POST batch cuttered at a time. The cache is only used on the event loop thread, between chunks.
+_CHUNK = 8192
+
+
+class LRUCache:
+    """ A bounded word -> cutter cache that drops the least recently used word when it's full. """
+    def __init__(self, size):
+        self.size = size
+        self.items = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, word):
+        cutter = self.items.get(word)
+        if cutter is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.items.move_to_end(word)
+        return cutter
+
+    def put(self, word, cutter):
+        self.items[word] = cutter
+        self.items.move_to_end(word)
+        if len(self.items) > self.size:
+            self.items.popitem(last=False)
+
+
+def cutter_many(words):
+    """ Cutter a list of words, using the NumPy path for large batches when it's available. """
+    if len(words) >= _VECTOR_MIN:
+        try:
+            return get_cutters(words).tolist()
+        except ImportError:
+            pass
+    return [get_cutter(word) for word in words]
+
+
+class CutterService:
+    def __init__(self, max_batch=256, max_delay=0.0005, cache_size=100000):
+        """
+        :param max_batch: the most single-word requests answered together
+        :param max_delay: seconds to wait for more requests before answering a batch that isn't full
+        :param cache_size: number of words kept in the LRU cache, 0 for no cache
+        """
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.cache = LRUCache(cache_size) if cache_size else None
+        self.queue = None
+        self.batcher = None
+        self.server = None
+
+    async def start(self, host="127.0.0.1", port=8080):
+        self.queue = asyncio.Queue()
+        self.batcher = asyncio.create_task(self._batch_loop())
+        self.server = await asyncio.start_server(self._handle_connection, host, port)
+        return self.server
+
+    async def serve_forever(self, host="127.0.0.1", port=8080):
+        server = await self.start(host, port)
+        async with server:
+            await server.serve_forever()
+
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+        self.batcher.cancel()
+
+    async def cutter(self, word):
+        """ Return the cutter of one word, batched together with any other words waiting. """
+        if self.cache is not None:
+            cutter = self.cache.get(word)
+            if cutter is not None:
+                return cutter
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((word, future))
+        return await future
+
+    async def cutters(self, words):
+        """
+        Return the cutters of a list of words. The list is already a batch, so it isn't queued; the words missing from
+        the cache are cuttered on a worker thread, _CHUNK at a time.
+        """
+        loop = asyncio.get_running_loop()
+        results = []
+        for start in range(0, len(words), _CHUNK):
+            chunk = words[start:start + _CHUNK]
+            if self.cache is None:
+                results += await loop.run_in_executor(None, cutter_many, chunk)
+                continue
+            found = [self.cache.get(word) for word in chunk]
+            missing = [index for index, cutter in enumerate(found) if cutter is None]
+            if missing:
+                cutters = await loop.run_in_executor(None, cutter_many, [chunk[index] for index in missing])
+                for index, cutter in zip(missing, cutters):
+                    found[index] = cutter
+                    self.cache.put(chunk[index], cutter)
+            results += found
+        return results
+
+    async def _batch_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch:
+                if self.queue.empty():
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    batch.append(self.queue.get_nowait())
+            words = [word for word, _ in batch]
+            for (word, future), cutter in zip(batch, cutter_many(words)):
+                if self.cache is not None:
+                    self.cache.put(word, cutter)
+                if not future.done():
+                    future.set_result(cutter)
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "bad request line"}, False)
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+                length = headers.get("content-length") or "0"
+                if not (length.isascii() and length.isdigit()):
+                    await self._respond(writer, 400, {"error": "bad Content-Length"}, False)
+                    break
+                length = int(length)
+                if length > MAX_BODY:
+                    await self._respond(writer, 413, {"error": "request body too large"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+                status, payload = await self._route(method, target, body)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    async def _route(self, method, target, body):
+        url = urlsplit(target)
+        if url.path == "/cutter":
+            if method != "GET":
+                return 405, {"error": "use GET"}
+            words = parse_qs(url.query).get("word")
+            if not words:
+                return 400, {"error": "missing word parameter"}
+            return 200, {"word": words[0], "cutter": await self.cutter(words[0])}
+        if url.path == "/cutters":
+            if method != "POST":
+                return 405, {"error": "use POST"}
+            try:
+                data = await asyncio.get_running_loop().run_in_executor(None, json.loads, body)
+            except ValueError:
+                return 400, {"error": "body is not JSON"}
+            words = data.get("words") if isinstance(data, dict) else data
+            if not isinstance(words, list) or not all(isinstance(word, str) for word in words):
+                return 400, {"error": 'expected {"words": [...]} or a list of strings'}
+            return 200, {"cutters": await self.cutters(words)}
+        if url.path == "/health":
+            stats = {"status": "ok"}
+            if self.cache is not None:
+                stats.update(cache_size=len(self.cache.items), cache_hits=self.cache.hits,
+                             cache_misses=self.cache.misses)
+            return 200, stats
+        return 404, {"error": "not found"}
+
+    @staticmethod
+    async def _respond(writer, status, payload, keep_alive):
+        body = json.dumps(payload).encode("utf-8")
+        writer.write(("HTTP/1.1 %d %s\r\nContent-Type: application/json\r\nContent-Length: %d\r\nConnection: %s\r\n\r\n"
+                      % (status, _REASONS[status], len(body), "keep-alive" if keep_alive else "close")).encode("ascii")
+                     + body)
+        await writer.drain()
+
+
+def serve(host="127.0.0.1", port=8080, **kwargs):
+    """ Run the service until interrupted. """
+    try:
+        asyncio.run(CutterService(**kwargs).serve_forever(host, port))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,156 @@
+"""
+LCCutter is released under "The MIT License (MIT)"
+
+Copyright © 2023 Joseph Alway
+
+See LCCutter.py for the full license text.
+"""
+
+
+import marshal
+import os
+import sys
+import zlib
+
+
+"""
+Cutter tables as data. Each table is a JSON file in the tables directory, e.g. tables/lc-2017-06-13.json:
+
+    version       a name for this revision of the rules; cached results are keyed by it
+    initials      [{"letters": first letters, "second": {second letters: digits}}, ...]
+                  later entries win, so a general rule can come first and the exceptions after it
+    third_letter  [{"prefixes": [two letter prefixes], "short": digits for the two letter word,
+                    "third": {third letters: digits}, "expand_third": whether the third letter is also expanded}, ...]
+    expansion     {letters: the character each later letter adds to the cutter, one ASCII character like "3"}
+
+Letters are written as comma separated ASCII letters and ranges, e.g. "a-d, t", and digits as ASCII strings. A table is compiled to flat lookup dicts
+(prefix -> cutter head, character -> expansion digit) once, and the compiled form is cached next to the table in
+__pycache__, keyed by a hash of the file, so a normal start neither parses JSON nor runs the compiler.
+"""
+
+TABLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tables")
+DEFAULT_TABLE = "lc-2017-06-13"
+# Change this when the compiled form changes, so old cache files are not read.
+_FORMAT = 2
+
+
+def table_path(table=None):
+    """
+    Return the file of a table.
+    :param table: the name of a file in TABLES_DIR without ".json", a path to a table file, or None for DEFAULT_TABLE
+    """
+    if table is None:
+        table = DEFAULT_TABLE
+    if table.endswith(".json") or os.sep in table or (os.altsep and os.altsep in table):
+        return table
+    return os.path.join(TABLES_DIR, table + ".json")
+
+
+def available_tables():
+    """ Return the names of the tables in TABLES_DIR. """
+    return sorted(name[:-len(".json")] for name in os.listdir(TABLES_DIR) if name.endswith(".json"))
+
+
+def _letters(spec):
+    """ Return the letters of a spec like "a-d, t". """
+    letters = []
+    for part in spec.replace(" ", "").split(","):
+        if len(part) == 1:
+            letters.append(part)
+        elif len(part) == 3 and part[1] == "-" and part[0] <= part[2]:
+            letters.extend(chr(code) for code in range(ord(part[0]), ord(part[2]) + 1))
+        else:
+            raise ValueError("bad letters %r, use letters and ranges like \"a-d, t\"" % spec)
+    if not all(letter.isascii() for letter in letters):
+        raise ValueError("bad letters %r, only ASCII letters can be in a cutter" % spec)
+    return letters
+
+
+def _add(table, prefix, rules):
+    for spec, digits in rules.items():
+        if not digits.isascii():
+            raise ValueError("bad digits %r for %r, only ASCII can be in a cutter" % (digits, spec))
+        for letter in _letters(spec):
+            table[prefix + letter] = "." + prefix[0].upper() + digits
+
+
+def compile_table(data):
+    """
+    Compile the parsed JSON of a table to the lookups CutterEngine uses.
+    :return: a dict with the version and the heads, short, third, skip_third and expansion lookups
+    """
+    heads = {}
+    short = {}
+    third = {}
+    skip_third = []
+    expansion = {}
+    try:
+        version = data["version"]
+        for initial in data["initials"]:
+            for first in _letters(initial["letters"]):
+                _add(heads, first, initial["second"])
+        for rule in data.get("third_letter", ()):
+            for prefix in rule["prefixes"]:
+                if len(prefix) != 2:
+                    raise ValueError("third_letter prefixes have two letters, not %r" % prefix)
+                if not rule["short"].isascii():
+                    raise ValueError("bad digits %r for %r, only ASCII can be in a cutter" % (rule["short"], prefix))
+                short[prefix] = "." + prefix[0].upper() + rule["short"]
+                _add(third, prefix, rule["third"])
+                if not rule.get("expand_third", True):
+                    skip_third.append(prefix)
+                # The third letter decides these, not the second.
+                heads.pop(prefix, None)
+        for spec, characters in data["expansion"].items():
+            # The NumPy and bytes batch paths add exactly one byte per letter.
+            if len(characters) != 1 or not "!" <= characters <= "~":
+                raise ValueError("malformed cutter table: the expansion for %r has to be one ASCII character, not %r"
+                                 % (spec, characters))
+            for letter in _letters(spec):
+                expansion[ord(letter)] = characters
+    except (KeyError, TypeError, AttributeError) as error:
+        raise ValueError("malformed cutter table: %r" % error)
+    if not isinstance(version, str) or not version:
+        raise ValueError("malformed cutter table: the version has to be a non-empty string")
+    return {"version": version, "heads": heads, "short": short, "third": third, "skip_third": skip_third,
+            "expansion": expansion}
+
+
+def _cache_path(path, data):
+    # crc32 is enough to notice an edited table, and zlib imports much faster than hashlib.
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(os.path.dirname(path), "__pycache__", "%s.%s.%08x-%d.marshal"
+                        % (stem, sys.implementation.cache_tag, zlib.crc32(data), _FORMAT))
+
+
+def load_table(table=None):
+    """
+    Return the compiled form of a table, see compile_table. It comes from the __pycache__ file when that matches the
+    table file, otherwise the table is compiled and the cache file written, when the directory is writable.
+    :param table: see table_path
+    """
+    path = table_path(table)
+    with open(path, "rb") as table_file:
+        data = table_file.read()
+    cache = _cache_path(path, data)
+    try:
+        with open(cache, "rb") as cache_file:
+            return marshal.load(cache_file)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    # json is only needed when a table changed, so keep it out of the usual start up.
+    import json
+    try:
+        compiled = compile_table(json.loads(data.decode("utf-8")))
+    except ValueError as error:
+        raise ValueError("%s: %s" % (path, error))
+    try:
+        os.makedirs(os.path.dirname(cache), exist_ok=True)
+        temporary = "%s.%d.tmp" % (cache, os.getpid())
+        with open(temporary, "wb") as cache_file:
+            marshal.dump(compiled, cache_file)
+        os.replace(temporary, cache)
+    except OSError:
+        # A read-only install still works, it just compiles the table on every start.
+        pass
+    return compiled
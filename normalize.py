@@ -0,0 +1,67 @@
+"""
+LCCutter is released under "The MIT License (MIT)"
+
+Copyright © 2023 Joseph Alway
+
+See LCCutter.py for the full license text.
+"""
+
+
+import functools
+import unicodedata
+
+
+"""
+Folds letters with diacritics and special letters to their romanized filing forms before cuttering, e.g. "Émile" to
+"Emile", "Øster" to "Oster" and "Þór" to "Thor". The cutter table only knows a to z, so without this those letters
+were dropped.
+
+The fold table is built once at import; folding a heading is then one str.translate call, and repeated headings come
+from a bounded memo cache. ASCII headings are returned as they are without touching either.
+"""
+
+# Letters that don't decompose into a base letter and a diacritic, and their filing forms.
+SPECIAL_LETTERS = {
+    "Æ": "Ae", "æ": "ae", "Œ": "Oe", "œ": "oe", "Ø": "O", "ø": "o", "ß": "ss", "ẞ": "SS", "Þ": "Th", "þ": "th",
+    "Ð": "D", "ð": "d", "Đ": "D", "đ": "d", "Ł": "L", "ł": "l", "Ħ": "H", "ħ": "h", "ı": "i", "Ŋ": "Ng", "ŋ": "ng",
+    "Ŧ": "T", "ŧ": "t", "ĸ": "q", "ſ": "s", "Ƒ": "F", "ƒ": "f", "Ɨ": "I", "ɨ": "i", "Ƶ": "Z", "ƶ": "z",
+}
+# Latin-1 Supplement, Latin Extended-A and -B, and Latin Extended Additional.
+_LATIN_RANGES = ((0x00C0, 0x0250), (0x1E00, 0x1F00))
+# Combining Diacritical Marks, their Extended and Supplement blocks, marks for symbols and half marks. In decomposed
+# (NFD) text, e.g. from macOS file names or MARC records, the diacritic is its own character after the base letter.
+_COMBINING_RANGES = ((0x0300, 0x0370), (0x1AB0, 0x1B00), (0x1DC0, 0x1E00), (0x20D0, 0x2100), (0xFE20, 0xFE30))
+# Number of distinct non-ASCII headings remembered.
+CACHE_SIZE = 65536
+
+
+def _build_table():
+    table = {}
+    for start, end in _LATIN_RANGES:
+        for code in range(start, end):
+            char = chr(code)
+            # NFKD splits a letter into its base letter and combining marks, and ligatures like "ĳ" into letters.
+            folded = "".join(part for part in unicodedata.normalize("NFKD", char) if part.isascii() and part.isalpha())
+            if folded:
+                table[code] = folded
+    for char, folded in SPECIAL_LETTERS.items():
+        table[ord(char)] = folded
+    # Deleted, so "E" and "\u0301" fold like "É".
+    for start, end in _COMBINING_RANGES:
+        table.update(dict.fromkeys(range(start, end)))
+    return table
+
+
+FOLD_TABLE = _build_table()
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _fold(word):
+    return word.translate(FOLD_TABLE)
+
+
+def fold(word):
+    """ Return word with diacritics and special letters folded to their filing forms. Other characters are kept. """
+    if word.isascii():
+        return word
+    return _fold(word)
@@ -0,0 +1,122 @@
+"""
+LCCutter is released under "The MIT License (MIT)"
+
+Copyright © 2023 Joseph Alway
+
+See LCCutter.py for the full license text.
+"""
+
+
+import collections
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from LCCutter import iter_cutters
+
+
+"""
+Multi-core batch mode. Input files are split into byte ranges that end on a line break, each range is cuttered in a
+worker process, and the results are written back in input order.
+"""
+
+# Default size of one chunk of input in bytes.
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def chunk_ranges(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Split a file into (start, end) byte ranges of about chunk_size bytes. Every range except the last ends just after
+    a line break, so no line is split between two chunks.
+    """
+    size = os.path.getsize(path)
+    ranges = []
+    with open(path, "rb") as in_file:
+        start = 0
+        while start < size:
+            end = start + chunk_size
+            if end < size:
+                in_file.seek(end)
+                in_file.readline()
+                end = in_file.tell()
+            else:
+                end = size
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def cutter_chunk(task):
+    """
+    Cutter one byte range of a file. Runs in a worker process.
+    :param task: (path, start, end, with_word, encoding, filing, table)
+    :return: (output text, number of records, seconds spent, worker process id)
+    """
+    path, start, end, with_word, encoding, filing, table = task
+    began = time.perf_counter()
+    with open(path, "rb") as in_file:
+        in_file.seek(start)
+        data = in_file.read(end - start)
+    # StringIO with newline=None splits lines the same way reading the file in text mode does.
+    words = (line.strip(" \t\r\n") for line in io.StringIO(data.decode(encoding), newline=None))
+    lines = list(iter_cutters(words, with_word, filing=filing, table=table))
+    return "".join(lines), len(lines), time.perf_counter() - began, os.getpid()
+
+
+def parallel_batch(files, output=None, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, with_word=False,
+                   encoding="utf-8", report=sys.stderr, filing=None, table=None):
+    """
+    Cutter every line of the input files on a pool of worker processes and write the cutters in input order.
+    At most two chunks per worker are in flight at once, so memory use does not grow with the input size.
+    :param files: input file paths. stdin can't be split into byte ranges, use LCCutter.batch for it.
+    :param workers: number of worker processes (default: the number of CPUs)
+    :param report: stream for the per-worker throughput report, or None for no report
+    :param filing: see LCCutter.iter_cutters; it's sent to the workers, so it has to be picklable
+    :param table: the cutter table name or path, see LCCutter.get_engine; each worker loads it once
+    :return: the number of lines written
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    tasks = ((path, start, end, with_word, encoding, filing, table)
+             for path in files for start, end in chunk_ranges(path, chunk_size))
+    # Records and seconds per worker process.
+    stats = collections.defaultdict(lambda: [0, 0.0])
+    count = 0
+    began = time.perf_counter()
+    if output is None or output == "-":
+        out_file = sys.stdout
+    else:
+        out_file = open(output, "w", encoding=encoding)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = collections.deque()
+            for task in tasks:
+                pending.append(pool.submit(cutter_chunk, task))
+                if len(pending) >= 2 * workers:
+                    count += _write_result(pending.popleft().result(), out_file, stats)
+            while pending:
+                count += _write_result(pending.popleft().result(), out_file, stats)
+    finally:
+        if out_file is not sys.stdout:
+            out_file.close()
+    if report is not None:
+        _report(stats, count, time.perf_counter() - began, report)
+    return count
+
+
+def _write_result(result, out_file, stats):
+    text, records, seconds, pid = result
+    out_file.write(text)
+    stats[pid][0] += records
+    stats[pid][1] += seconds
+    return records
+
+
+def _report(stats, count, seconds, report):
+    for number, (pid, (records, busy)) in enumerate(sorted(stats.items()), 1):
+        rate = records / busy if busy else 0.0
+        report.write("worker %d (pid %d): %d records in %.2f s, %.0f records/s\n" % (number, pid, records, busy, rate))
+    rate = count / seconds if seconds else 0.0
+    report.write("total: %d records in %.2f s, %.0f records/s\n" % (count, seconds, rate))
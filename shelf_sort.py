@@ -0,0 +1,195 @@
+"""
+LCCutter is released under "The MIT License (MIT)"
+
+Copyright © 2023 Joseph Alway
+
+See LCCutter.py for the full license text.
+"""
+
+
+import heapq
+import itertools
+import operator
+import os
+import re
+import shutil
+import sys
+import tempfile
+
+
+"""
+Sorts LC call numbers into shelf order.
+
+Every call number is turned into a compact binary sort key once, and the keys are compared as plain bytes:
+
+    class letters   the letters, then a 0 byte, so "P" files before "PA"
+    class number    the number of integer digits, the digits, then the decimal digits and a 0 byte, so 76 files
+                    before 100 and 76.73 before 76.9
+    then, in order, one entry per part of the rest of the call number:
+    a number        1, the number of digits, the digits (e.g. a date, which files before any cutter)
+    a cutter        2, the letter, the digits, then a 0 byte. Cutters are decimal fractions, so ".B25" files before
+                    ".B3", and the "U" that get_cutter uses as an expansion character files between 8 and 9
+    a word          3, the word, then a 0 byte
+
+The 0 bytes end each entry below any digit or letter, so a shorter call number files before the longer ones it
+begins. Input that fits in chunk_lines lines is sorted in memory; anything larger is sorted in chunks that are written
+to temporary run files and merged, so memory use is bounded by the chunk size whatever the input size.
+"""
+
+# Lines sorted in memory at a time. Each line and its key take a few hundred bytes.
+DEFAULT_CHUNK_LINES = 1000000
+# Run files merged at once; more runs are merged in several passes so the number of open files stays bounded.
+MERGE_WIDTH = 64
+
+_CALL_NUMBER_RE = re.compile(rb"\s*([A-Z]{1,3})(?![A-Z])\s*(?:(\d+)(?:\.(\d+))?)?")
+# Cutter characters in filing order: the digits, with the expansion "U" between 8 and 9.
+_CUTTER_DIGITS = bytes.maketrans(b"012345678U9", b"0123456789:")
+_NUMBER, _CUTTER, _WORD = b"\x01", b"\x02", b"\x03"
+# What cutter_key accepts once the dot is gone: the letter, then digits and expansion "U"s, if any.
+_CUTTER_TEXT_RE = re.compile(r"[A-Z][0-9U]*\Z")
+# Keys of lines that don't start like a call number file after all the others, in text order.
+_UNPARSED = b"\xff"
+# _LENGTHS[n] is the length byte for n digits.
+_LENGTHS = [bytes([length]) for length in range(256)]
+
+
+def _number(digits):
+    digits = digits.lstrip(b"0") or b"0"
+    return _LENGTHS[len(digits)] + digits if len(digits) < 256 else _LENGTHS[255] + digits
+
+
+def cutter_key(cutter):
+    """
+    Return the sort key entry of one cutter, e.g. ".S62" or "S62", as used in sort_key. Just the letter, ".S", is a
+    cutter too. Raises ValueError for anything else.
+    """
+    text = cutter.lstrip(". ").upper()
+    if not _CUTTER_TEXT_RE.match(text):
+        raise ValueError("not a cutter: %r" % cutter)
+    cutter = text.encode("ascii")
+    return _CUTTER + cutter[:1] + cutter[1:].translate(_CUTTER_DIGITS) + b"\x00"
+
+
+def sort_key(call_number):
+    """ Return the shelf order sort key of a call number, e.g. "QA76.73.P98 L88 2010", as bytes. """
+    text = call_number.strip().upper().encode("utf-8")
+    match = _CALL_NUMBER_RE.match(text)
+    if match is None:
+        return _UNPARSED + text
+    letters, integer, decimals = match.groups()
+    parts = [letters, b"\x00"]
+    if integer is None:
+        parts.append(b"\x00")
+    else:
+        parts.append(_number(integer))
+        if decimals:
+            parts.append(decimals)
+        parts.append(b"\x00")
+    # The rest is split on spaces and dots, which is much cheaper than matching each part with a regular expression.
+    for part in text[match.end():].replace(b".", b" ").split():
+        if part.isdigit():
+            parts += (_NUMBER, _number(part))
+        elif part[1:2].isdigit() and part[:1].isalpha() and not part[1:].translate(None, b"0123456789U"):
+            parts += (_CUTTER, part[:1], part[1:].translate(_CUTTER_DIGITS), b"\x00")
+        else:
+            parts += (_WORD, part, b"\x00")
+    return b"".join(parts)
+
+
+def sort_call_numbers(call_numbers):
+    """ Return the call numbers in shelf order. Call numbers with the same key keep their input order. """
+    return sorted(call_numbers, key=sort_key)
+
+
+def _read_lines(files, encoding):
+    if not files:
+        files = ["-"]
+    for path in files:
+        if path == "-":
+            for line in sys.stdin:
+                yield line.rstrip("\r\n")
+        else:
+            with open(path, encoding=encoding) as in_file:
+                for line in in_file:
+                    yield line.rstrip("\r\n")
+
+
+def _write_run(records, path, encoding):
+    """ Write (key, line) records to a run file: the key length, the key, then the line ending in "\\n". """
+    with open(path, "wb") as run_file:
+        for key, line in records:
+            run_file.write(len(key).to_bytes(4, "little"))
+            run_file.write(key)
+            run_file.write(line.encode(encoding))
+            run_file.write(b"\n")
+
+
+def _read_run(path, encoding):
+    with open(path, "rb") as run_file:
+        while True:
+            size = run_file.read(4)
+            if not size:
+                break
+            key = run_file.read(int.from_bytes(size, "little"))
+            yield key, run_file.readline()[:-1].decode(encoding)
+
+
+def _merge(paths, encoding):
+    """ Merge sorted run files. Equal keys come from the earlier run first, which keeps the sort stable. """
+    return heapq.merge(*(_read_run(path, encoding) for path in paths), key=operator.itemgetter(0))
+
+
+def shelf_sort(files=None, output=None, encoding="utf-8", chunk_lines=DEFAULT_CHUNK_LINES, temp_dir=None):
+    """
+    Sort the call numbers in the input files, one per line, into shelf order.
+    :param files: paths to read in order, or None / "-" for stdin
+    :param output: output path, or None / "-" for stdout
+    :param chunk_lines: lines sorted in memory at a time; larger inputs are merged from temporary run files
+    :param temp_dir: directory for the run files (default: the system temporary directory)
+    :return: the number of lines written
+    """
+    lines = _read_lines(files, encoding)
+    first = list(itertools.islice(lines, chunk_lines))
+    if len(first) < chunk_lines:
+        # It all fits in one chunk: no run files.
+        records = ((None, line) for line in sort_call_numbers(first))
+        return _write_lines(records, output, encoding)
+    work_dir = tempfile.mkdtemp(prefix="shelf_sort-", dir=temp_dir)
+    try:
+        runs = []
+        chunk = first
+        while chunk:
+            records = sorted(((sort_key(line), line) for line in chunk), key=operator.itemgetter(0))
+            runs.append(os.path.join(work_dir, "run%d" % len(runs)))
+            _write_run(records, runs[-1], encoding)
+            del records
+            chunk = list(itertools.islice(lines, chunk_lines))
+        # Merge MERGE_WIDTH runs at a time until one pass can merge the rest.
+        generation = 0
+        while len(runs) > MERGE_WIDTH:
+            merged = []
+            for start in range(0, len(runs), MERGE_WIDTH):
+                group = runs[start:start + MERGE_WIDTH]
+                merged.append(os.path.join(work_dir, "merge%d-%d" % (generation, len(merged))))
+                _write_run(_merge(group, encoding), merged[-1], encoding)
+                for path in group:
+                    os.remove(path)
+            runs = merged
+            generation += 1
+        return _write_lines(_merge(runs, encoding), output, encoding)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def _write_lines(records, output, encoding):
+    count = 0
+    out_file = sys.stdout if output is None or output == "-" else open(output, "w", encoding=encoding)
+    try:
+        for key, line in records:
+            out_file.write(line)
+            out_file.write("\n")
+            count += 1
+    finally:
+        if out_file is not sys.stdout:
+            out_file.close()
+    return count
@@ -0,0 +1,116 @@
+"""
+LCCutter is released under "The MIT License (MIT)"
+
+Copyright © 2023 Joseph Alway
+
+See LCCutter.py for the full license text.
+"""
+
+
+import bisect
+import re
+
+
+"""
+An in-memory index of the cutters already on the shelves, so new cutters can be checked against existing holdings.
+
+A cutter only collides with the same cutter in the same class number: ".P98" in QA76.73 doesn't take ".P98" in PS3545.
+So the shelflist is keyed by class number and cutter, e.g. "QA76.73.P98", and a new cutter is checked through a
+ClassShelflist for the class it will file in. A line that is only a cutter has no class number, key ".P98", and is
+taken in every class.
+"""
+
+# The first cutter in a call number: a dot, a letter, then digits and expansion "U"s, e.g. "PS3545.I345 A6 1990".
+# A dot followed by a digit is part of the class number and is skipped.
+_CUTTER_RE = re.compile(r"\.\s*([A-Z][0-9U]*)")
+# A cutter on its own, without the dot, e.g. "S6584".
+BARE_CUTTER_RE = re.compile(r"[A-Z][0-9U]+$")
+
+
+def class_key(class_number):
+    """ Return a class number the way shelf keys hold it: upper case, without spaces or a final dot, e.g. "QA76.73". """
+    return "".join(class_number.upper().split()).rstrip(".")
+
+
+def extract_shelf_key(call_number):
+    """
+    Return the class number and first cutter of a call number as one key, e.g. "QA76.73.P98" for
+    "QA76.73.P98 L88 2010", or just the cutter, ".P98", for a line that is only a cutter. Returns None if there is no
+    cutter.
+    """
+    call_number = call_number.strip().upper()
+    match = _CUTTER_RE.search(call_number)
+    if match:
+        return class_key(call_number[:match.start()]) + "." + match.group(1)
+    if BARE_CUTTER_RE.match(call_number):
+        return "." + call_number
+    return None
+
+
+def extract_cutter(call_number):
+    """
+    Return the first cutter of a call number in the form get_cutter returns it, e.g. ".I345".
+    A line that is only a cutter, with or without the dot, works too. Returns None if there is no cutter.
+    """
+    call_number = call_number.strip().upper()
+    match = _CUTTER_RE.search(call_number)
+    if match:
+        return "." + match.group(1)
+    if BARE_CUTTER_RE.match(call_number):
+        return "." + call_number
+    return None
+
+
+class Shelflist:
+    """
+    The shelf keys already in use, see extract_shelf_key, kept sorted so lookups are a binary search.
+    Keys added after loading go to a set, so adding stays cheap however large the loaded list is.
+    """
+    def __init__(self, cutters=()):
+        self.cutters = sorted(set(cutters))
+        self.added = set()
+
+    @classmethod
+    def load(cls, path, encoding="utf-8"):
+        """ Build a Shelflist from a file with one call number or cutter per line. Lines without a cutter are skipped. """
+        with open(path, encoding=encoding) as in_file:
+            return cls(key for key in map(extract_shelf_key, in_file) if key)
+
+    def __len__(self):
+        return len(self.cutters) + len(self.added)
+
+    def __contains__(self, cutter):
+        index = bisect.bisect_left(self.cutters, cutter)
+        return (index < len(self.cutters) and self.cutters[index] == cutter) or cutter in self.added
+
+    def add(self, cutter):
+        if cutter not in self:
+            self.added.add(cutter)
+
+    def starting_with(self, prefix):
+        """ Return every cutter that starts with prefix, in sorted order. """
+        start = bisect.bisect_left(self.cutters, prefix)
+        end = bisect.bisect_left(self.cutters, prefix + "\uffff", start)
+        found = self.cutters[start:end]
+        found.extend(cutter for cutter in self.added if cutter.startswith(prefix))
+        return sorted(found)
+
+    def has_class_numbers(self):
+        """ Return whether any key has a class number. Keys without one start with ".", which sorts before letters. """
+        return bool(self.cutters) and not self.cutters[-1].startswith(".")
+
+
+class ClassShelflist:
+    """
+    The cutters taken in one class number of a Shelflist or cutter_index.CutterIndex: those filed under the class and
+    those listed without one. Has the __contains__ / add interface LCCutter.get_cutter uses.
+    """
+    def __init__(self, shelflist, class_number):
+        self.shelflist = shelflist
+        self.prefix = class_key(class_number)
+
+    def __contains__(self, cutter):
+        return self.prefix + cutter in self.shelflist or cutter in self.shelflist
+
+    def add(self, cutter):
+        self.shelflist.add(self.prefix + cutter)
@@ -0,0 +1,86 @@
+"""
+LCCutter is released under "The MIT License (MIT)"
+
+Copyright © 2023 Joseph Alway
+
+See LCCutter.py for the full license text.
+"""
+
+
+import itertools
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bytes_batch import cutter_block
+from cutter_tables import load_table, table_path
+from LCCutter import get_cutter, get_cutters
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+"""
+A local cutter table has to give the same cutters through get_cutter, get_cutters and the bytes batch mode, and a
+table that one of them can't use has to be refused when it's loaded.
+"""
+
+
+def _local_table():
+    with open(table_path(), encoding="utf-8") as table_file:
+        data = json.load(table_file)
+    data["version"] = "test-local"
+    # A longer head than any in the LC table, and another expansion digit for "u".
+    data["initials"].append({"letters": "b", "second": {"a": "123", "e": "4"}})
+    data["expansion"]["u"] = "8"
+    return data
+
+
+class LocalTableTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def write_table(self, data):
+        path = os.path.join(self.directory, "%s.json" % data["version"])
+        with open(path, "w", encoding="utf-8") as table_file:
+            json.dump(data, table_file)
+        return path
+
+    def test_all_paths_agree(self):
+        table = self.write_table(_local_table())
+        words = ["".join(letters) for length in (2, 3, 4) for letters in itertools.product("abeqsu", repeat=length)]
+        words += ["Bacon", "smith", "Quinn", "bauhaus"]
+        expected = [get_cutter(word, table=table) for word in words]
+        self.assertEqual(get_cutter("bat", table=table), ".B1238")
+        self.assertEqual(get_cutter("smut", table=table), ".S688")
+        block = "".join(word + "\n" for word in words).encode("ascii")
+        self.assertEqual(bytes(cutter_block(block, table=table)).decode("ascii").splitlines(), expected)
+        if numpy is not None:
+            self.assertEqual([str(cutter) for cutter in get_cutters(words, table=table)], expected)
+
+    def test_bad_expansions_are_refused(self):
+        for value in ("9U", "", " ", "é"):
+            data = _local_table()
+            data["version"] = "test-bad-%d" % len(os.listdir(self.directory))
+            data["expansion"]["u"] = value
+            path = self.write_table(data)
+            with self.assertRaises(ValueError, msg=repr(value)):
+                load_table(path)
+
+    def test_non_ascii_letters_are_refused(self):
+        data = _local_table()
+        data["initials"].append({"letters": "é", "second": {"a": "3"}})
+        with self.assertRaises(ValueError):
+            load_table(self.write_table(data))
+
+
+if __name__ == "__main__":
+    unittest.main()
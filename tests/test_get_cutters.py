@@ -0,0 +1,88 @@
+"""
+LCCutter is released under "The MIT License (MIT)"
+
+Copyright © 2023 Joseph Alway
+
+See LCCutter.py for the full license text.
+"""
+
+
+import itertools
+import os
+import string
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from LCCutter import _ENGINE, VECTOR_WIDTH, get_cutter, get_cutters
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+"""
+get_cutters must give the same cutter as get_cutter for every word. Checked over every word of one to three letters,
+the prefixes whose digit depends on the third letter (sc and qu to qz), the words whose table cutter ends in 0 or 1,
+words with NUL characters, which NumPy takes for padding, and long words mixed in with short ones.
+"""
+
+
+def _words(alphabet, lengths):
+    return ["".join(letters) for length in lengths for letters in itertools.product(alphabet, repeat=length)]
+
+
+@unittest.skipUnless(numpy, "get_cutters needs NumPy")
+class GetCuttersParityTest(unittest.TestCase):
+    def assert_parity(self, words):
+        vector = get_cutters(words)
+        self.assertEqual(len(vector), len(words))
+        for word, cutter in zip(words, vector):
+            # A NumPy string can't end in a NUL character, so "\0\0" is ".\0" from get_cutter and "." here.
+            self.assertEqual(str(cutter), get_cutter(word).rstrip("\0"), repr(word))
+
+    def test_short_words(self):
+        self.assert_parity(_words(string.ascii_lowercase, (1, 2, 3)))
+
+    def test_mixed_case(self):
+        self.assert_parity(_words("aBqUsCz", (1, 2, 3, 4)))
+
+    def test_third_letter_prefixes(self):
+        words = []
+        for prefix in sorted(_ENGINE.short):
+            words.append(prefix)
+            words += [prefix + rest for rest in _words(string.ascii_lowercase, (1, 2))]
+        self.assert_parity(words)
+
+    def test_zero_and_one_endings(self):
+        words = [word for word in _words(string.ascii_lowercase, (2, 3)) if _ENGINE.cutter(word)[-1] in "01"]
+        self.assertTrue(words)
+        self.assert_parity(words + [word + "a" for word in words] + [word.upper() for word in words])
+
+    def test_other_characters(self):
+        self.assert_parity(_words("a1 -'", (2, 3)) + ["qu1", "sc-", "a b", "Ab-c", "10", "  "])
+
+    def test_nul_characters(self):
+        words = ["\0ab", "ab\0", "a\0b", "a\0", "\0\0", "ab\0\0c", "sc\0", "qu\0a", "\0"]
+        self.assert_parity(words)
+        self.assert_parity(numpy.array(words))
+
+    def test_long_words(self):
+        words = _words("abqs", (2, 3, 4)) * 40
+        words[7] = "smith" * 400
+        words[-1] = "q" + "u" * VECTOR_WIDTH
+        self.assert_parity(words)
+        self.assert_parity(numpy.array(words))
+        # The long cutters don't widen the others: they are kept as Python strings.
+        self.assertEqual(get_cutters(words).dtype, object)
+
+    def test_short_words_stay_narrow(self):
+        cutters = get_cutters(_words("abqs", (2, 3, 4)) + ["x" * VECTOR_WIDTH])
+        self.assertEqual(cutters.dtype.kind, "U")
+        self.assertLessEqual(cutters.dtype.itemsize, 4 * 2 * VECTOR_WIDTH)
+
+
+if __name__ == "__main__":
+    unittest.main()
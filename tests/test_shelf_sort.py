@@ -0,0 +1,109 @@
+"""
+LCCutter is released under "The MIT License (MIT)"
+
+Copyright © 2023 Joseph Alway
+
+See LCCutter.py for the full license text.
+"""
+
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shelf_sort import cutter_key, shelf_sort, sort_call_numbers, sort_key
+
+
+"""
+Call numbers sort in shelf order: class numbers as numbers, cutters as decimals with U between 8 and 9, a date before
+a cutter, and a call number before the longer ones it begins. The external merge must give the same order as the
+in-memory sort.
+"""
+
+
+# In shelf order.
+_SHELF = [
+    "P35 .A1",
+    "PS3545 2001",
+    "PS3545 .B25",
+    "PS3545 .B3",
+    "PS3545 .S78",
+    "PS3545 .S7U4",
+    "PS3545 .S79",
+    "QA76 .P98",
+    "QA76.73 1999",
+    "QA76.73 .P98",
+    "QA76.73 .P98 L88",
+    "QA76.73 .P98 L88 2010",
+    "QA76.8 .A1",
+    "QA100 .B3",
+    "QB5 .A1",
+]
+
+
+class ShelfOrderTest(unittest.TestCase):
+    def assert_before(self, first, second):
+        self.assertLess(sort_key(first), sort_key(second), "%s before %s" % (first, second))
+
+    def test_class_numbers_sort_as_numbers(self):
+        self.assert_before("QA76", "QA100")
+        self.assert_before("QA76.73", "QA76.8")
+        self.assert_before("QA76.73", "QA100")
+
+    def test_cutters_sort_as_decimals(self):
+        self.assert_before("PS3545.B25", "PS3545.B3")
+        self.assertLess(cutter_key(".B25"), cutter_key("B3"))
+
+    def test_u_files_between_8_and_9(self):
+        self.assert_before("PS3545.S78", "PS3545.S7U4")
+        self.assert_before("PS3545.S7U4", "PS3545.S79")
+
+    def test_date_before_cutter(self):
+        self.assert_before("QA76.73 2010", "QA76.73.A1")
+
+    def test_prefix_first(self):
+        self.assert_before("QA76.73.P98", "QA76.73.P98 L88")
+        self.assert_before("QA76.73.P98 L88", "QA76.73.P98 L88 2010")
+
+    def test_sort_call_numbers(self):
+        shuffled = list(_SHELF)
+        random.Random(4).shuffle(shuffled)
+        self.assertEqual(sort_call_numbers(shuffled), _SHELF)
+
+    def test_not_a_cutter(self):
+        with self.assertRaises(ValueError):
+            cutter_key("P98 L88")
+
+
+class ExternalMergeTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def sort_file(self, lines, chunk_lines):
+        path = os.path.join(self.directory, "in.txt")
+        output = os.path.join(self.directory, "out-%d.txt" % chunk_lines)
+        with open(path, "w", encoding="utf-8") as out_file:
+            out_file.write("".join(line + "\n" for line in lines))
+        count = shelf_sort([path], output, chunk_lines=chunk_lines, temp_dir=self.directory)
+        self.assertEqual(count, len(lines))
+        with open(output, encoding="utf-8") as in_file:
+            return in_file.read().splitlines()
+
+    def test_merge_matches_in_memory_sort(self):
+        lines = list(_SHELF) * 3 + ["not a call number", "QA76.73 .P98 L88"]
+        random.Random(16).shuffle(lines)
+        in_memory = self.sort_file(lines, len(lines) + 1)
+        self.assertEqual(in_memory, sort_call_numbers(lines))
+        self.assertEqual(self.sort_file(lines, 2), in_memory)
+        # The run files are removed.
+        self.assertEqual(sorted(os.listdir(self.directory)), ["in.txt", "out-2.txt", "out-%d.txt" % (len(lines) + 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
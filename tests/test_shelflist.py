@@ -0,0 +1,79 @@
+"""
+LCCutter is released under "The MIT License (MIT)"
+
+Copyright © 2023 Joseph Alway
+
+See LCCutter.py for the full license text.
+"""
+
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cutter_index import CutterIndex, read_export
+from LCCutter import get_cutter
+from shelflist import ClassShelflist, Shelflist, extract_shelf_key
+
+
+"""
+A cutter is only taken within its own class number: a catalog-wide shelflist or index must not stop a new PS book
+from getting a cutter that is only used in QA. Cutters listed without a class number are taken in every class.
+"""
+
+
+_CALL_NUMBERS = ["QA76.73.P98 L88 2010", "ps3545 .s6 2001", "PS3545.B3366 1999", ".J6"]
+
+
+class ShelfKeyTest(unittest.TestCase):
+    def test_keys(self):
+        self.assertEqual(extract_shelf_key("QA76.73.P98 L88 2010"), "QA76.73.P98")
+        self.assertEqual(extract_shelf_key("ps3545 .s6 2001"), "PS3545.S6")
+        self.assertEqual(extract_shelf_key("J6"), ".J6")
+        self.assertIsNone(extract_shelf_key("QA76"))
+
+
+class ClassNumberTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "shelflist.txt")
+        with open(self.path, "w", encoding="utf-8") as out_file:
+            out_file.write("".join(call_number + "\n" for call_number in _CALL_NUMBERS))
+
+    def assert_class_scoped(self, shelflist):
+        self.assertTrue(shelflist.has_class_numbers())
+        ps = ClassShelflist(shelflist, "PS3545")
+        self.assertNotIn(".P98", ps)
+        self.assertIn(".S6", ps)
+        self.assertIn(".B3366", ps)
+        self.assertIn(".J6", ps)
+        self.assertIn(".P98", ClassShelflist(shelflist, "qa76.73"))
+        self.assertNotIn(".S6", ClassShelflist(shelflist, "QA76.73"))
+        # "bacon" is .B3366, taken in PS3545 only. The cutter it gets instead is then taken there and nowhere else.
+        self.assertEqual(get_cutter("bacon", ClassShelflist(shelflist, "PS3546")), ".B3366")
+        cutter = get_cutter("bacon", ps)
+        self.assertNotEqual(cutter, ".B3366")
+        self.assertIn(cutter, ps)
+        self.assertNotIn(cutter, ClassShelflist(shelflist, "PS3547"))
+
+    def test_shelflist(self):
+        self.assert_class_scoped(Shelflist.load(self.path))
+
+    def test_index(self):
+        path = os.path.join(self.directory, "holdings.idx")
+        CutterIndex.build(path, read_export(self.path)).close()
+        index = CutterIndex(path, writable=True)
+        self.addCleanup(index.close)
+        self.assert_class_scoped(index)
+
+    def test_bare_cutters(self):
+        self.assertFalse(Shelflist([".J6", ".P98"]).has_class_numbers())
+
+
+if __name__ == "__main__":
+    unittest.main()
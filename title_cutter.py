@@ -0,0 +1,127 @@
+"""
+LCCutter is released under "The MIT License (MIT)"
+
+Copyright © 2023 Joseph Alway
+
+See LCCutter.py for the full license text.
+"""
+
+
+import functools
+
+from LCCutter import get_cutter
+from normalize import fold
+
+
+"""
+Cutters for full titles and corporate names. An initial article is skipped ("The old man and the sea" files under
+"Old"), then spaces and punctuation are dropped so the cutter runs over the letters of the following words.
+
+The articles of all the chosen languages are compiled once into a prefix trie, so finding the article is a single
+walk over the first few characters of the title, whatever the number of languages.
+"""
+
+# The article languages used when none are given. Articles of other languages are common English words ("Die Hard",
+# "El Paso", "O Pioneers!"), so they are only skipped when asked for.
+DEFAULT_LANGUAGES = ("english",)
+# Initial articles by language. An article ending in an apostrophe or hyphen is joined straight to the next word
+# ("L'amour", "al-Qahirah"); any other article has to be followed by a space.
+ARTICLES = {
+    "english": ("a", "an", "the"),
+    "french": ("le", "la", "les", "l'", "un", "une"),
+    "german": ("der", "die", "das", "den", "dem", "des", "ein", "eine", "einer", "eines", "einem", "einen"),
+    "spanish": ("el", "la", "lo", "los", "las", "un", "una", "unos", "unas"),
+    "italian": ("il", "lo", "la", "i", "gli", "le", "l'", "un", "uno", "una", "un'"),
+    "portuguese": ("o", "a", "os", "as", "um", "uma", "uns", "umas"),
+    "catalan": ("el", "la", "els", "les", "l'", "un", "una"),
+    "dutch": ("de", "het", "een", "'t", "'n"),
+    "danish": ("en", "et", "den", "det", "de"),
+    "norwegian": ("en", "ei", "et", "den", "det", "de"),
+    "swedish": ("en", "ett", "den", "det", "de"),
+    "hungarian": ("a", "az", "egy"),
+    "arabic": ("al-", "el-"),
+}
+# Marks the end of an article in the trie.
+_END = ""
+# Typographic apostrophes count as "'".
+_APOSTROPHES = str.maketrans({"’": "'", "ʼ": "'"})
+
+
+class _Filing(dict):
+    """ A str.translate table that keeps letters and digits and deletes everything else. """
+    def __missing__(self, code):
+        char = chr(code)
+        value = char if char.isalnum() else None
+        self[code] = value
+        return value
+
+
+_FILING = _Filing()
+# The same for ASCII text, as a bytes.translate delete set, which is much faster.
+_ASCII_DROP = bytes(code for code in range(128) if not chr(code).isalnum())
+
+
+def _letters_and_digits(text):
+    if text.isascii():
+        return text.encode("ascii").translate(None, _ASCII_DROP).decode("ascii")
+    return text.translate(_FILING)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_articles(languages=None):
+    """
+    Return the article trie for a tuple of language names, or for every language in ARTICLES when None.
+    Each node is a dict of next character -> node, and has an _END key when an article ends there.
+    """
+    if languages is None:
+        languages = tuple(ARTICLES)
+    root = {}
+    for language in languages:
+        for article in ARTICLES[language]:
+            node = root
+            for char in article:
+                node = node.setdefault(char, {})
+            node[_END] = True
+    return root
+
+
+def filing_title(title, languages=DEFAULT_LANGUAGES):
+    """
+    Return the letters and digits of a title after its initial article, folded and lower case, e.g.
+    "The Old Man and the Sea" -> "oldmanandthesea".
+    :param languages: a tuple of names from ARTICLES, or None for all of them (default: DEFAULT_LANGUAGES)
+    """
+    text = title if title.isascii() else fold(title).translate(_APOSTROPHES)
+    length = len(text)
+    start = 0
+    # Skip opening quotes, brackets and the like. An apostrophe can start an article ("'t Hooft").
+    while start < length and not text[start].isalnum() and text[start] != "'":
+        start += 1
+    node = compile_articles(languages)
+    position = start
+    skip_to = start
+    while position < length:
+        node = node.get(text[position].lower())
+        if node is None:
+            break
+        position += 1
+        if _END in node and (text[position - 1] in "'-" or (position < length and text[position].isspace())):
+            skip_to = position
+    rest = _letters_and_digits(text[skip_to:])
+    # A title that is only an article ("The") keeps it.
+    if not rest:
+        rest = _letters_and_digits(text[start:])
+    return rest.lower()
+
+
+def title_cutter(title, languages=DEFAULT_LANGUAGES, shelflist=None, table=None):
+    """ Return the cutter of a title or corporate name, see filing_title. """
+    return get_cutter(filing_title(title, languages), shelflist, table)
+
+
+def filing_function(languages=DEFAULT_LANGUAGES):
+    """
+    Return a function that maps a title to its filing title, for LCCutter.iter_cutters(filing=...).
+    It can be sent to worker processes.
+    """
+    return functools.partial(filing_title, languages=languages)